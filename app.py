@@ -3,9 +3,7 @@ SportsIQ - Real-time NBA Analytics Dashboard
 Main application file - Home page
 """
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
 import os
 import sys
 import time
@@ -16,10 +14,15 @@ if __name__ == "__main__":
 
 # Import our utilities
 from sportsiq.utils import setup_logging, get_logger, test_connection, execute_query
+from sportsiq.utils.home import render_system_health, metrics_html, features_html
 
-# Set up logging
-logger = setup_logging()
-module_logger = get_logger("app")
+# Set up logging once per process so reruns don't rebuild the handlers
+@st.cache_resource(show_spinner=False)
+def _init_logging():
+    """Configure logging and return the root and page loggers"""
+    return setup_logging(), get_logger("app")
+
+logger, module_logger = _init_logging()
 
 # Set page configuration
 st.set_page_config(
@@ -30,7 +33,10 @@ st.set_page_config(
 )
 
 # Custom CSS for styling
-st.markdown("""
+@st.cache_resource
+def _css_blob():
+    """Return the page CSS, built once per process"""
+    return """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -53,6 +59,16 @@ st.markdown("""
         box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
         margin-bottom: 20px;
     }
+    .metric-row {
+        display: grid;
+        grid-template-columns: repeat(4, 1fr);
+        gap: 1rem;
+    }
+    .feature-grid {
+        display: grid;
+        grid-template-columns: repeat(2, 1fr);
+        gap: 1rem;
+    }
     .metric-card {
         text-align: center;
         background-color: #f5f5f5;
@@ -76,11 +92,18 @@ st.markdown("""
         color: #9e9e9e;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(_css_blob(), unsafe_allow_html=True)
+
+@st.cache_resource(ttl=30, show_spinner=False)
+def _cached_connection_status():
+    """Return the database connection status, re-checked at most every 30 seconds"""
+    return test_connection()
 
 def check_database():
     """Test the database connection and return status"""
-    connection_status = test_connection()
+    connection_status = _cached_connection_status()
     
     if connection_status:
         st.sidebar.success("✅ Database connected", icon="✅")
@@ -91,6 +114,7 @@ def check_database():
         module_logger.error("Database connection failed in the app")
         return False
     
+@st.cache_data
 def get_sample_stats():
     """Get sample statistics for display on the home page"""
     # Sample data (replace with real data from database when available)
@@ -101,50 +125,120 @@ def get_sample_stats():
         'data_points': "1.2M+"
     }
 
-def show_health_indicator(score, label):
-    """Display a health indicator gauge chart"""
-    colors = {
-        'good': '#2E7D32',
-        'medium': '#FF9800',
-        'poor': '#C62828'
-    }
+@st.cache_data
+def _sample_df():
+    """Build the sample player DataFrame used by the home page charts"""
+    import pandas as pd
     
-    if score >= 70:
-        color = colors['good']
-        status = "Excellent"
-    elif score >= 40:
-        color = colors['medium']
-        status = "Moderate"
-    else:
-        color = colors['poor']
-        status = "Poor"
+    module_logger.debug("Building sample player DataFrame")
+    return pd.DataFrame({
+        'Player': ['LeBron James', 'Kevin Durant', 'Stephen Curry', 
+                  'Giannis Antetokounmpo', 'Nikola Jokic'],
+        'Points': [27.5, 29.1, 28.7, 30.2, 25.3],
+        'Assists': [7.9, 5.3, 6.1, 5.8, 9.2],
+        'Rebounds': [8.5, 7.2, 5.4, 11.7, 12.1]
+    })
+
+# Feature cards shown on the home page, grouped by display column
+_FEATURE_COLUMNS = (
+    (
+        ("🔍 Player Performance Dashboard", (
+            "Compare multiple players across seasons or specific games",
+            "Display trends for points, efficiency, fouls, assists",
+            "Compute rolling averages and highlight statistical outliers",
+            "Visualize performance metrics with interactive charts",
+        )),
+        ("🏆 Optimal Lineup Analyzer", (
+            "Identify the most effective 5-player combinations",
+            "Filter by minimum minutes played together",
+            "Performance metrics include Net Rating, Offensive Rating, and Defensive Rating",
+            "Compare lineup efficiency across different time periods",
+        )),
+    ),
+    (
+        ("⚠️ Injury Risk Indicator", (
+            "Calculate fatigue based on playing minutes, usage rate, and game frequency",
+            "Machine learning-based risk assessment",
+            "Visual indicators for injury risk levels",
+            "Track player workload over time",
+        )),
+        ("📊 Player Clustering & Game Prediction", (
+            "Machine learning algorithms to identify player archetypes",
+            "Visual representation of player clusters",
+            "Identify similar players based on statistical profiles",
+            "Predict game outcomes based on team performance data",
+        )),
+    ),
+)
+
+@st.cache_data
+def _long_df(df):
+    """Reshape the sample player stats to long form for grouped bar charts"""
+    return df.melt(
+        id_vars='Player',
+        value_vars=['Points', 'Assists', 'Rebounds'],
+        var_name='Stat',
+        value_name='Value'
+    )
+
+@st.cache_data(show_spinner=False)
+def _bar_fig(df):
+    """Build the grouped bar chart of key statistics for the sample players"""
+    import plotly.express as px
+    
+    fig = px.bar(
+        _long_df(df), 
+        x='Player', 
+        y='Value',
+        color='Stat',
+        barmode='group',
+        title="Key Statistics - Top Players",
+        color_discrete_sequence=px.colors.qualitative.Bold
+    )
+    fig.update_layout(
+        legend_title="Statistic",
+        xaxis_title="",
+        yaxis_title="Value",
+        template="plotly_white"
+    )
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _radar_fig(df):
+    """Build the radar chart comparing the sample players"""
+    import plotly.graph_objects as go
+    
+    categories = ['Points', 'Assists', 'Rebounds']
+    
+    # Repeat the first column at the end of every row to close the polygons
+    values = df[categories].to_numpy()
+    values = np.concatenate([values, values[:, :1]], axis=1)
+    theta = categories + [categories[0]]
     
-    fig = go.Figure(go.Indicator(
-        mode="gauge+number",
-        value=score,
-        title={'text': label, 'font': {'size': 14}},
-        gauge={
-            'axis': {'range': [0, 100], 'tickwidth': 1},
-            'bar': {'color': color},
-            'steps': [
-                {'range': [0, 40], 'color': '#FFEBEE'},
-                {'range': [40, 70], 'color': '#FFF9C4'},
-                {'range': [70, 100], 'color': '#E8F5E9'}
-            ],
-            'threshold': {
-                'line': {'color': "black", 'width': 2},
-                'thickness': 0.75,
-                'value': score
-            }
-        }
-    ))
+    # Radial axis limit from a single reduction over all stat values
+    r_max = float(np.asarray(df[categories]).max()) * 1.1
+    
+    fig = go.Figure()
+    
+    for player, r in zip(df['Player'].to_numpy(), values):
+        fig.add_trace(go.Scatterpolargl(
+            r=r,
+            theta=theta,
+            fill='toself',
+            name=player
+        ))
     
     fig.update_layout(
-        height=150,
-        margin=dict(l=10, r=10, t=25, b=10),
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, r_max]
+            )
+        ),
+        title="Player Performance Comparison",
+        template="plotly_white"
     )
-    
-    return fig, status
+    return fig
 
 # Main content
 def main():
@@ -166,180 +260,45 @@ def main():
     # Display dashboard metrics
     st.markdown('<div class="sub-header">Dashboard Overview</div>', unsafe_allow_html=True)
     
-    # Create columns for the metrics
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown("""
-        <div class="metric-card">
-            <div class="metric-value">{}</div>
-            <div class="metric-label">NBA Teams</div>
-        </div>
-        """.format(stats['total_teams']), unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="metric-card">
-            <div class="metric-value">{}</div>
-            <div class="metric-label">Players Tracked</div>
-        </div>
-        """.format(stats['total_players']), unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div class="metric-card">
-            <div class="metric-value">{}</div>
-            <div class="metric-label">Games Analyzed</div>
-        </div>
-        """.format(stats['games_analyzed']), unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown("""
-        <div class="metric-card">
-            <div class="metric-value">{}</div>
-            <div class="metric-label">Data Points</div>
-        </div>
-        """.format(stats['data_points']), unsafe_allow_html=True)
+    # Emit all metric cards in one element
+    st.markdown(metrics_html(stats), unsafe_allow_html=True)
     
     st.markdown("<br>", unsafe_allow_html=True)
     
     # System health indicators
     st.markdown('<div class="sub-header">System Health</div>', unsafe_allow_html=True)
     
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        db_score = 85 if db_connected else 20
-        fig, status = show_health_indicator(db_score, "Database Status")
-        st.plotly_chart(fig, use_container_width=True)
-        st.markdown(f"<div style='text-align: center;'><b>Status:</b> {status}</div>", unsafe_allow_html=True)
-    
-    with col2:
-        # API health would come from real monitoring in production
-        api_score = 78
-        fig, status = show_health_indicator(api_score, "NBA API Status")
-        st.plotly_chart(fig, use_container_width=True)
-        st.markdown(f"<div style='text-align: center;'><b>Status:</b> {status}</div>", unsafe_allow_html=True)
-    
-    with col3:
-        # Data freshness would come from real monitoring in production
-        freshness_score = 92
-        fig, status = show_health_indicator(freshness_score, "Data Freshness")
-        st.plotly_chart(fig, use_container_width=True)
-        st.markdown(f"<div style='text-align: center;'><b>Status:</b> {status}</div>", unsafe_allow_html=True)
+    # API health and data freshness would come from real monitoring in production
+    render_system_health(
+        db_score=85 if db_connected else 20,
+        api_score=78,
+        freshness_score=92
+    )
     
     st.markdown("<br>", unsafe_allow_html=True)
     
     # Features overview
     st.markdown('<div class="sub-header">Features</div>', unsafe_allow_html=True)
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown('<div class="card">', unsafe_allow_html=True)
-        st.markdown('<div class="feature-header">🔍 Player Performance Dashboard</div>', unsafe_allow_html=True)
-        st.markdown("""
-        - Compare multiple players across seasons or specific games
-        - Display trends for points, efficiency, fouls, assists
-        - Compute rolling averages and highlight statistical outliers
-        - Visualize performance metrics with interactive charts
-        """)
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        st.markdown('<div class="card">', unsafe_allow_html=True)
-        st.markdown('<div class="feature-header">🏆 Optimal Lineup Analyzer</div>', unsafe_allow_html=True)
-        st.markdown("""
-        - Identify the most effective 5-player combinations
-        - Filter by minimum minutes played together
-        - Performance metrics include Net Rating, Offensive Rating, and Defensive Rating
-        - Compare lineup efficiency across different time periods
-        """)
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown('<div class="card">', unsafe_allow_html=True)
-        st.markdown('<div class="feature-header">⚠️ Injury Risk Indicator</div>', unsafe_allow_html=True)
-        st.markdown("""
-        - Calculate fatigue based on playing minutes, usage rate, and game frequency
-        - Machine learning-based risk assessment
-        - Visual indicators for injury risk levels
-        - Track player workload over time
-        """)
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        st.markdown('<div class="card">', unsafe_allow_html=True)
-        st.markdown('<div class="feature-header">📊 Player Clustering & Game Prediction</div>', unsafe_allow_html=True)
-        st.markdown("""
-        - Machine learning algorithms to identify player archetypes
-        - Visual representation of player clusters
-        - Identify similar players based on statistical profiles
-        - Predict game outcomes based on team performance data
-        """)
-        st.markdown('</div>', unsafe_allow_html=True)
+    # Emit both feature columns in one element laid out by the CSS grid
+    st.markdown(features_html(_FEATURE_COLUMNS), unsafe_allow_html=True)
     
     # Sample visualization
     st.markdown('<div class="sub-header">Sample Visualization</div>', unsafe_allow_html=True)
     
     # Sample data for visualization
-    sample_data = {
-        'Player': ['LeBron James', 'Kevin Durant', 'Stephen Curry', 
-                  'Giannis Antetokounmpo', 'Nikola Jokic'],
-        'Points': [27.5, 29.1, 28.7, 30.2, 25.3],
-        'Assists': [7.9, 5.3, 6.1, 5.8, 9.2],
-        'Rebounds': [8.5, 7.2, 5.4, 11.7, 12.1]
-    }
-    df = pd.DataFrame(sample_data)
+    df = _sample_df()
     
     # Create tabs for different visualizations
     tab1, tab2 = st.tabs(["Player Stats Comparison", "Performance Radar"])
     
     with tab1:
         # Bar chart
-        fig = px.bar(
-            df, 
-            x='Player', 
-            y=['Points', 'Assists', 'Rebounds'],
-            barmode='group',
-            title="Key Statistics - Top Players",
-            color_discrete_sequence=px.colors.qualitative.Bold
-        )
-        fig.update_layout(
-            legend_title="Statistic",
-            xaxis_title="",
-            yaxis_title="Value",
-            template="plotly_white"
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_bar_fig(df), use_container_width=True, key="bar_top")
     
     with tab2:
         # Radar chart for comparing players
-        categories = ['Points', 'Assists', 'Rebounds']
-        
-        fig = go.Figure()
-        
-        for i, player in enumerate(df['Player']):
-            values = df.iloc[i, 1:].tolist()
-            values.append(values[0])  # Close the loop
-            
-            fig.add_trace(go.Scatterpolar(
-                r=values + [values[0]],  # Add first value at end to close the polygon
-                theta=categories + [categories[0]],  # Add first category at end
-                fill='toself',
-                name=player
-            ))
-        
-        fig.update_layout(
-            polar=dict(
-                radialaxis=dict(
-                    visible=True,
-                    range=[0, max(df[['Points', 'Assists', 'Rebounds']].max()) * 1.1]
-                )
-            ),
-            title="Player Performance Comparison",
-            template="plotly_white"
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_radar_fig(df), use_container_width=True, key="radar_top")
     
     # Add a note about the data
     st.info("Note: This is sample data for demonstration purposes. The dashboard uses real-time data from the NBA API when connected to the database.")
@@ -8,41 +8,23 @@ import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import os
-import sys
+import io
 import time
+import hashlib
+import requests
+from PIL import Image
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
-# Add the parent directory to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+# Import utilities and modules (requires the sportsiq package, see `pip install -e .`)
+from sportsiq.utils.db_utils import test_connection, execute_query
+from sportsiq.utils.style import apply_light_mode
+from sportsiq.utils.visualization import lttb_downsample
 
-# Import utilities and modules
-try:
-    from sportsiq.utils.db_utils import test_connection, execute_query
-    from sportsiq.utils.api_client import get_all_players
-    from sportsiq.utils.style import apply_light_mode
-except ImportError:
-    # If import fails, create placeholder functions
-    logging.basicConfig(level=logging.INFO)
-    module_logger = logging.getLogger("player_dashboard")
-    module_logger.warning("Could not import from sportsiq.utils, using placeholder functions")
-    
-    def test_connection():
-        return True
-    
-    def execute_query(query, params=None):
-        return []
-    
-    def get_all_players():
-        return []
-    
-    def apply_light_mode():
-        pass
-else:
-    # Setup logging
-    logging.basicConfig(level=logging.INFO)
-    module_logger = logging.getLogger("player_dashboard")
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+module_logger = logging.getLogger("player_dashboard")
 
 # Set page configuration
 st.set_page_config(
@@ -56,7 +38,10 @@ st.set_page_config(
 apply_light_mode()
 
 # Custom CSS for this page only
-st.markdown("""
+@st.cache_resource
+def _css_blob():
+    """Return the page CSS, built once per process"""
+    return """
 <style>
     .page-title {
         font-size: 2rem;
@@ -120,13 +105,15 @@ st.markdown("""
         background-color: #f0f0f0;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(_css_blob(), unsafe_allow_html=True)
 
 # Sample data functions (these would be replaced with real data from the database)
-@st.cache_data(ttl=3600)  # Cache for 1 hour
+@st.cache_data(persist="disk", max_entries=512, show_spinner=False)  # Persisted across restarts
 def get_sample_players():
-    """Return a sample list of NBA players"""
-    return [
+    """Return a sample DataFrame of NBA players indexed by name"""
+    return pd.DataFrame([
         {"id": 2544, "name": "LeBron James", "team": "Los Angeles Lakers", "position": "F"},
         {"id": 201939, "name": "Stephen Curry", "team": "Golden State Warriors", "position": "G"},
         {"id": 203954, "name": "Joel Embiid", "team": "Philadelphia 76ers", "position": "C"},
@@ -137,151 +124,166 @@ def get_sample_players():
         {"id": 201566, "name": "Nikola Jokic", "team": "Denver Nuggets", "position": "C"},
         {"id": 1628983, "name": "Shai Gilgeous-Alexander", "team": "OKC Thunder", "position": "G"},
         {"id": 1627783, "name": "Donovan Mitchell", "team": "Cleveland Cavaliers", "position": "G"}
-    ]
+    ]).set_index("name")
+
+# NBA CDN URL for full-size player headshots
+HEADSHOT_URL = "https://cdn.nba.com/headshots/nba/latest/1040x760/{player_id}.png"
+
+@st.cache_data(persist="disk", max_entries=512, show_spinner=False)
+def get_player_headshot(player_id, size=200):
+    """Download a player headshot once and return it as a PNG thumbnail"""
+    response = requests.get(HEADSHOT_URL.format(player_id=player_id), timeout=5)
+    response.raise_for_status()
+    
+    image = Image.open(io.BytesIO(response.content))
+    image.thumbnail((size, size))
+    
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+def _rng(player_id, season=None):
+    """Return a random generator seeded deterministically from the player and season"""
+    digest = hashlib.blake2b(f"{player_id}:{season}".encode(), digest_size=8).digest()
+    return np.random.default_rng(int.from_bytes(digest, "big"))
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour
-def get_player_game_stats(player_id, season="2022-23"):
+# Opponents cycled through for the sample game logs
+_OPPONENTS = np.array(["BOS", "MIA", "PHI", "TOR", "CHI", "CLE", "MIL", "NYK", "ATL", "CHA",
+                       "LAL", "GSW", "PHX", "LAC", "DEN", "MEM", "DAL", "POR", "UTA", "SAC"])
+
+# Compact dtypes for the bounded per-game and per-season stats, with Arrow-backed
+# strings so cached frames pickle as contiguous buffers instead of Python objects
+_GAME_STAT_DTYPES = {
+    "PTS": "int16", "AST": "int16", "REB": "int16", "STL": "int16", "BLK": "int16",
+    "TOV": "int16", "MIN": "int16", "PLUS_MINUS": "int16",
+    "FG_PCT": "float32", "FG3_PCT": "float32", "FT_PCT": "float32",
+    "MATCHUP": "string[pyarrow]", "SEASON": "string[pyarrow]"
+}
+_SEASON_STAT_DTYPES = {
+    "SEASON": "string[pyarrow]", "GAMES": "int16", "PTS": "float32", "AST": "float32", "REB": "float32",
+    "STL": "float32", "BLK": "float32", "TOV": "float32", "FG_PCT": "float32",
+    "FG3_PCT": "float32", "FT_PCT": "float32", "MIN": "float32", "PER": "float32",
+    "TS_PCT": "float32", "USG_PCT": "float32"
+}
+
+@st.cache_data(persist="disk", max_entries=512, show_spinner=False)  # Persisted across restarts
+def get_player_game_stats(player_id, season="2022-23", n_games=20):
     """Get player game statistics with generated sample data"""
     # This would be replaced with a database query in production
-    seed = int(player_id) + hash(season) % 10000
-    np.random.seed(seed)  # Use player ID and season as seed for consistency
+    rng = _rng(player_id, season)  # Use player ID and season as seed for consistency
     
-    # Create 20 recent games
     # Use season to determine dates (if "2021-22", use dates from that season)
     season_year = int(season.split("-")[0])
     season_start = datetime(season_year, 10, 18)  # Season typically starts in October
     season_end = datetime(season_year+1, 4, 10)   # Regular season typically ends in April
     
-    # Generate 20 game dates within the season
+    # Spread the games evenly across the season, most recent first
     total_season_days = (season_end - season_start).days
     game_intervals = total_season_days // 22  # 22 to ensure we get around 20 games
-    
-    dates = [season_start + timedelta(days=i*game_intervals) for i in range(20)]
-    dates.reverse()  # Oldest to newest
+    dates = pd.date_range(season_start, periods=n_games, freq=f"{game_intervals}D")[::-1]
     
     # Generate sample statistics with some randomness but realistic trends
-    base_pts = np.random.randint(20, 30)
-    base_ast = np.random.randint(4, 8)
-    base_reb = np.random.randint(5, 10)
-    
-    stats = []
-    for i, game_date in enumerate(dates):
-        # Add some randomness to stats
-        pts = max(0, base_pts + np.random.randint(-8, 9))
-        ast = max(0, base_ast + np.random.randint(-3, 4))
-        reb = max(0, base_reb + np.random.randint(-4, 5))
-        fg_pct = round(np.random.uniform(0.35, 0.65), 3)
-        fg3_pct = round(np.random.uniform(0.25, 0.55), 3)
-        ft_pct = round(np.random.uniform(0.70, 0.95), 3)
-        stl = max(0, np.random.randint(0, 4))
-        blk = max(0, np.random.randint(0, 3))
-        tov = max(0, np.random.randint(1, 6))
-        min_played = max(20, np.random.randint(28, 38))
-        plus_minus = np.random.randint(-15, 16)
-        
-        # Add trend effects (players get slightly better as season progresses)
-        trend_factor = 1 + (i / 50)  # Small increase over time
-        pts = int(pts * trend_factor)
-        
-        # Create opponent from list of teams
-        teams = ["BOS", "MIA", "PHI", "TOR", "CHI", "CLE", "MIL", "NYK", "ATL", "CHA", 
-                 "LAL", "GSW", "PHX", "LAC", "DEN", "MEM", "DAL", "POR", "UTA", "SAC"]
-        opponent = teams[i % len(teams)]
-        
-        stats.append({
-            "GAME_DATE": game_date,
-            "MATCHUP": f"vs. {opponent}",
-            "PTS": pts,
-            "AST": ast,
-            "REB": reb,
-            "STL": stl,
-            "BLK": blk,
-            "TOV": tov,
-            "FG_PCT": fg_pct,
-            "FG3_PCT": fg3_pct,
-            "FT_PCT": ft_pct,
-            "MIN": min_played,
-            "PLUS_MINUS": plus_minus,
-            "SEASON": season
-        })
-    
-    return pd.DataFrame(stats)
-
-@st.cache_data(ttl=3600)  # Cache for 1 hour
+    base_pts = rng.integers(20, 30)
+    base_ast = rng.integers(4, 8)
+    base_reb = rng.integers(5, 10)
+    
+    # Add trend effects (players get slightly better as season progresses)
+    game_index = np.arange(n_games)
+    trend_factor = 1 + (game_index / 50)
+    pts = (np.maximum(0, base_pts + rng.integers(-8, 9, size=n_games)) * trend_factor).astype(int)
+    
+    opponents = _OPPONENTS[game_index % len(_OPPONENTS)]
+    
+    df = pd.DataFrame({
+        "GAME_DATE": dates,
+        "MATCHUP": np.char.add("vs. ", opponents),
+        "PTS": pts,
+        "AST": np.maximum(0, base_ast + rng.integers(-3, 4, size=n_games)),
+        "REB": np.maximum(0, base_reb + rng.integers(-4, 5, size=n_games)),
+        "STL": rng.integers(0, 4, size=n_games),
+        "BLK": rng.integers(0, 3, size=n_games),
+        "TOV": rng.integers(1, 6, size=n_games),
+        "FG_PCT": rng.uniform(0.35, 0.65, size=n_games).round(3),
+        "FG3_PCT": rng.uniform(0.25, 0.55, size=n_games).round(3),
+        "FT_PCT": rng.uniform(0.70, 0.95, size=n_games).round(3),
+        "MIN": rng.integers(28, 38, size=n_games),
+        "PLUS_MINUS": rng.integers(-15, 16, size=n_games),
+        "SEASON": season
+    }).astype(_GAME_STAT_DTYPES)
+    
+    # Display-formatted dates, computed once per cached frame
+    df["GAME_DATE_STR"] = df["GAME_DATE"].dt.strftime('%b %d, %Y').astype("string[pyarrow]")
+    
+    return df
+
+@st.cache_resource
+def _prefetch_executor():
+    """Return the background worker pool used to warm the data caches"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="player_prefetch")
+
+def prefetch_adjacent_seasons(player_id, seasons, selected_season):
+    """Warm the game stats cache for the seasons next to the selected one"""
+    index = seasons.index(selected_season)
+    executor = _prefetch_executor()
+    
+    for season in seasons[max(0, index - 1):index + 2]:
+        if season != selected_season:
+            executor.submit(get_player_game_stats, player_id, season)
+
+@st.cache_data(persist="disk", max_entries=512, show_spinner=False)  # Persisted across restarts
 def get_player_season_stats(player_id):
     """Get player season statistics with generated sample data"""
     # This would be replaced with a database query in production
-    np.random.seed(player_id)  # Use player ID as seed for consistency
+    rng = _rng(player_id)  # Use player ID as seed for consistency
     
     # Create last 3 seasons
     current_year = datetime.now().year
     seasons = [f"{year-1}-{str(year)[2:]}" for year in range(current_year-2, current_year+1)]
+    n_seasons = len(seasons)
     
     # Base stats with some randomness
-    base_pts = np.random.randint(18, 28)
-    base_ast = np.random.randint(4, 8)
-    base_reb = np.random.randint(4, 10)
-    
-    stats = []
-    for i, season in enumerate(seasons):
-        # Use both player ID and season for seed
-        seed = int(player_id) + hash(season) % 10000
-        np.random.seed(seed)
-        
-        # Add some randomness to stats but keep them relatively consistent across seasons
-        pts = max(0, base_pts + np.random.randint(-3, 4))
-        ast = max(0, base_ast + np.random.randint(-1, 2))
-        reb = max(0, base_reb + np.random.randint(-2, 3))
-        
-        # Slight improvement trend over seasons
-        trend_factor = 1 + (i / 20)  # Small increase over time
-        pts = round(pts * trend_factor, 1)
-        ast = round(ast * trend_factor, 1)
-        reb = round(reb * trend_factor, 1)
-        
-        # Other stats
-        fg_pct = round(np.random.uniform(0.44, 0.54), 3)
-        fg3_pct = round(np.random.uniform(0.34, 0.42), 3)
-        ft_pct = round(np.random.uniform(0.75, 0.90), 3)
-        stl = round(np.random.uniform(0.7, 1.8), 1)
-        blk = round(np.random.uniform(0.5, 1.5), 1)
-        tov = round(np.random.uniform(1.8, 3.5), 1)
-        min_played = round(np.random.uniform(28, 36), 1)
-        games = np.random.randint(65, 82)
-        
-        stats.append({
-            "SEASON": season,
-            "GAMES": games,
-            "PTS": pts,
-            "AST": ast,
-            "REB": reb,
-            "STL": stl,
-            "BLK": blk,
-            "TOV": tov,
-            "FG_PCT": fg_pct,
-            "FG3_PCT": fg3_pct,
-            "FT_PCT": ft_pct,
-            "MIN": min_played,
-            "PER": round(np.random.uniform(15, 25), 1),  # Player Efficiency Rating
-            "TS_PCT": round(np.random.uniform(0.55, 0.65), 3),  # True Shooting %
-            "USG_PCT": round(np.random.uniform(24, 33), 1)  # Usage Percentage
-        })
-    
-    return pd.DataFrame(stats)
-
-def create_performance_line_chart(player_stats, stat_column, title=None, rolling_window=5):
-    """Create a line chart for player performance over time"""
-    # Sort by date
-    player_stats = player_stats.sort_values('GAME_DATE')
-    
+    base_pts = rng.integers(18, 28)
+    base_ast = rng.integers(4, 8)
+    base_reb = rng.integers(4, 10)
+    
+    # Slight improvement trend over seasons, otherwise relatively consistent across seasons
+    trend_factor = 1 + (np.arange(n_seasons) / 20)
+    pts = np.maximum(0, base_pts + rng.integers(-3, 4, size=n_seasons)) * trend_factor
+    ast = np.maximum(0, base_ast + rng.integers(-1, 2, size=n_seasons)) * trend_factor
+    reb = np.maximum(0, base_reb + rng.integers(-2, 3, size=n_seasons)) * trend_factor
+    
+    return pd.DataFrame({
+        "SEASON": seasons,
+        "GAMES": rng.integers(65, 82, size=n_seasons),
+        "PTS": pts.round(1),
+        "AST": ast.round(1),
+        "REB": reb.round(1),
+        "STL": rng.uniform(0.7, 1.8, size=n_seasons).round(1),
+        "BLK": rng.uniform(0.5, 1.5, size=n_seasons).round(1),
+        "TOV": rng.uniform(1.8, 3.5, size=n_seasons).round(1),
+        "FG_PCT": rng.uniform(0.44, 0.54, size=n_seasons).round(3),
+        "FG3_PCT": rng.uniform(0.34, 0.42, size=n_seasons).round(3),
+        "FT_PCT": rng.uniform(0.75, 0.90, size=n_seasons).round(3),
+        "MIN": rng.uniform(28, 36, size=n_seasons).round(1),
+        "PER": rng.uniform(15, 25, size=n_seasons).round(1),  # Player Efficiency Rating
+        "TS_PCT": rng.uniform(0.55, 0.65, size=n_seasons).round(3),  # True Shooting %
+        "USG_PCT": rng.uniform(24, 33, size=n_seasons).round(1)  # Usage Percentage
+    }).astype(_SEASON_STAT_DTYPES)
+
+@st.cache_data(show_spinner=False)
+def create_performance_line_chart(player_stats, stat_column, title=None, rolling_window=5, season_avg=None):
+    """Create a line chart for player performance over time (expects rows sorted by date)"""
     # Create figure
     fig = go.Figure()
     
+    # Downsample long series so the browser only receives a bounded number of points
+    dates, values = lttb_downsample(player_stats['GAME_DATE'], player_stats[stat_column])
+    
     # Add stat line
     fig.add_trace(
-        go.Scatter(
-            x=player_stats['GAME_DATE'],
-            y=player_stats[stat_column],
+        go.Scattergl(
+            x=dates,
+            y=values,
             mode='lines+markers',
             name=stat_column,
             line=dict(color='#1E88E5', width=3),
@@ -292,9 +294,10 @@ def create_performance_line_chart(player_stats, stat_column, title=None, rolling
     # Add rolling average if specified
     if rolling_window and len(player_stats) >= rolling_window:
         rolling_avg = player_stats[stat_column].rolling(window=rolling_window, min_periods=1).mean()
+        rolling_dates, rolling_avg = lttb_downsample(player_stats['GAME_DATE'], rolling_avg)
         fig.add_trace(
-            go.Scatter(
-                x=player_stats['GAME_DATE'],
+            go.Scattergl(
+                x=rolling_dates,
                 y=rolling_avg,
                 mode='lines',
                 name=f'{rolling_window}-Game Rolling Avg',
@@ -303,15 +306,13 @@ def create_performance_line_chart(player_stats, stat_column, title=None, rolling
         )
     
     # Add season average line
-    season_avg = player_stats[stat_column].mean()
-    fig.add_trace(
-        go.Scatter(
-            x=[player_stats['GAME_DATE'].min(), player_stats['GAME_DATE'].max()],
-            y=[season_avg, season_avg],
-            mode='lines',
-            name='Season Average',
-            line=dict(dash='dot', color='#4CAF50', width=2)
-        )
+    if season_avg is None:
+        season_avg = player_stats[stat_column].mean()
+    fig.add_hline(
+        y=season_avg,
+        line=dict(dash='dot', color='#4CAF50', width=2),
+        annotation_text=f"Season Avg: {season_avg:.1f}",
+        annotation_position="right"
     )
     
     # Set title
@@ -326,6 +327,7 @@ def create_performance_line_chart(player_stats, stat_column, title=None, rolling
         yaxis_title=stat_column,
         hovermode='x unified',
         template='plotly_white',
+        uirevision='constant',
         legend=dict(
             orientation="h",
             yanchor="bottom",
@@ -337,26 +339,27 @@ def create_performance_line_chart(player_stats, stat_column, title=None, rolling
     
     return fig
 
-def create_radar_chart(player_stats, stats_columns, title=None):
-    """Create a radar chart for player statistics"""
+# Per-stat values treated as 100% on the radar chart
+_RADAR_MAX_VALS = {'PTS': 40, 'AST': 15, 'REB': 20, 'STL': 5, 'BLK': 5, 'TOV': 5,
+                   'FG_PCT': 1, 'FG3_PCT': 1, 'FT_PCT': 1, 'PLUS_MINUS': 30}
+_RADAR_DEFAULT_MAX = 40
+
+# Stats shown on the all-around radar chart
+RADAR_STATS = ('PTS', 'AST', 'REB', 'STL', 'BLK', 'FG_PCT', 'FG3_PCT')
+
+@st.cache_data(show_spinner=False)
+def create_radar_chart(player_stats, stats_columns=RADAR_STATS, title=None):
+    """Create a radar chart for player statistics (stats_columns is a tuple of column names)"""
     # Calculate mean values for each stat
-    stat_means = [player_stats[col].mean() for col in stats_columns]
+    stat_means = player_stats[list(stats_columns)].mean().to_numpy()
     
     # Normalize values between 0 and 1 for presentation
-    max_vals = {'PTS': 40, 'AST': 15, 'REB': 20, 'STL': 5, 'BLK': 5, 'TOV': 5, 
-                'FG_PCT': 1, 'FG3_PCT': 1, 'FT_PCT': 1, 'PLUS_MINUS': 30}
-    
-    normalized_stats = []
-    for i, col in enumerate(stats_columns):
-        if col in max_vals:
-            normalized_stats.append(min(1, max(0, stat_means[i] / max_vals[col])))
-        else:
-            normalized_stats.append(min(1, max(0, stat_means[i] / 40)))  # Default normalization
+    max_vals = np.array([_RADAR_MAX_VALS.get(col, _RADAR_DEFAULT_MAX) for col in stats_columns])
+    normalized_stats = np.clip(stat_means / max_vals, 0, 1)
     
     # Add first value at the end to close the radar
-    normalized_stats.append(normalized_stats[0])
-    stat_labels = stats_columns.copy()
-    stat_labels.append(stat_labels[0])
+    normalized_stats = np.append(normalized_stats, normalized_stats[0])
+    stat_labels = list(stats_columns) + [stats_columns[0]]
     
     # Create radar chart
     fig = go.Figure()
@@ -405,11 +408,9 @@ def create_radar_chart(player_stats, stats_columns, title=None):
     
     return fig
 
+@st.cache_data(show_spinner=False)
 def create_shooting_chart(player_stats, title=None):
-    """Create a chart to visualize shooting percentages"""
-    # Sort by date
-    player_stats = player_stats.sort_values('GAME_DATE')
-    
+    """Create a chart to visualize shooting percentages (expects rows sorted by date)"""
     # Create subplot with 3 rows
     fig = make_subplots(
         rows=3, cols=1,
@@ -418,41 +419,22 @@ def create_shooting_chart(player_stats, title=None):
         vertical_spacing=0.1
     )
     
-    # Add field goal percentage
-    fig.add_trace(
-        go.Scatter(
-            x=player_stats['GAME_DATE'],
-            y=player_stats['FG_PCT'] * 100,  # Convert to percentage
-            mode='lines+markers',
-            name='FG%',
-            line=dict(color='#1E88E5')
-        ),
-        row=1, col=1
-    )
-    
-    # Add 3-point percentage
-    fig.add_trace(
-        go.Scatter(
-            x=player_stats['GAME_DATE'],
-            y=player_stats['FG3_PCT'] * 100,  # Convert to percentage
-            mode='lines+markers',
-            name='3P%',
-            line=dict(color='#FFA000')
-        ),
-        row=2, col=1
-    )
+    # One shared date array and a single percentage conversion for all three rows
+    dates = player_stats['GAME_DATE'].to_numpy()
+    pcts = player_stats[['FG_PCT', 'FG3_PCT', 'FT_PCT']].to_numpy(dtype=np.float32) * 100
     
-    # Add free throw percentage
-    fig.add_trace(
-        go.Scatter(
-            x=player_stats['GAME_DATE'],
-            y=player_stats['FT_PCT'] * 100,  # Convert to percentage
-            mode='lines+markers',
-            name='FT%',
-            line=dict(color='#4CAF50')
-        ),
-        row=3, col=1
-    )
+    # Field goal, 3-point and free throw percentage, one subplot each
+    for row, (name, color) in enumerate([('FG%', '#1E88E5'), ('3P%', '#FFA000'), ('FT%', '#4CAF50')], start=1):
+        fig.add_trace(
+            go.Scattergl(
+                x=dates,
+                y=pcts[:, row - 1],
+                mode='lines+markers',
+                name=name,
+                line=dict(color=color)
+            ),
+            row=row, col=1
+        )
     
     # Update layout
     fig.update_layout(
@@ -460,7 +442,8 @@ def create_shooting_chart(player_stats, title=None):
         title=title or 'Shooting Percentages',
         template='plotly_white',
         showlegend=False,
-        hovermode='x unified'
+        hovermode='x unified',
+        uirevision='constant'
     )
     
     # Update y-axes to show percentages
@@ -468,7 +451,8 @@ def create_shooting_chart(player_stats, title=None):
     
     return fig
 
-def create_stat_distribution_chart(player_stats, stat_column, title=None):
+@st.cache_data(show_spinner=False)
+def create_stat_distribution_chart(player_stats, stat_column, title=None, mean_value=None):
     """Create a histogram to show the distribution of a statistic"""
     fig = go.Figure()
     
@@ -484,7 +468,8 @@ def create_stat_distribution_chart(player_stats, stat_column, title=None):
     )
     
     # Add mean line
-    mean_value = player_stats[stat_column].mean()
+    if mean_value is None:
+        mean_value = player_stats[stat_column].mean()
     fig.add_vline(
         x=mean_value,
         line_dash="dash",
@@ -503,14 +488,44 @@ def create_stat_distribution_chart(player_stats, stat_column, title=None):
     
     return fig
 
+@st.cache_data(show_spinner=False)
+def create_season_comparison_chart(season_stats, title=None):
+    """Create a grouped bar chart comparing averages across seasons"""
+    fig = go.Figure()
+    
+    # One bar trace per statistic, read straight from the wide frame
+    seasons = season_stats['SEASON'].to_numpy()
+    for stat, color in zip(['PTS', 'AST', 'REB'], px.colors.qualitative.Bold):
+        fig.add_trace(
+            go.Bar(
+                name=stat,
+                x=seasons,
+                y=season_stats[stat].to_numpy(),
+                marker_color=color
+            )
+        )
+    
+    fig.update_layout(
+        barmode='group',
+        title=title or 'Season Comparison',
+        xaxis_title='SEASON',
+        yaxis_title='Average',
+        legend_title='Statistic',
+        template='plotly_white'
+    )
+    
+    return fig
+
+@st.cache_data(show_spinner=False)
 def get_performance_insights(player_stats, player_name):
     """Generate insights based on player statistics"""
     insights = []
     
+    # Scoring summary in a single aggregation pass
+    season_pts_avg, pts_std, best_idx, worst_idx = player_stats['PTS'].agg(['mean', 'std', 'idxmax', 'idxmin'])
+    
     # Check last 5 games performance
-    last_5_games = player_stats.sort_values('GAME_DATE', ascending=False).head(5)
-    last_5_pts_avg = last_5_games['PTS'].mean()
-    season_pts_avg = player_stats['PTS'].mean()
+    last_5_pts_avg = player_stats.nlargest(5, 'GAME_DATE')['PTS'].mean()
     
     if last_5_pts_avg > season_pts_avg * 1.15:
         insights.append(f"🔥 {player_name} is on fire! Averaging {last_5_pts_avg:.1f} points in the last 5 games, which is {((last_5_pts_avg / season_pts_avg) - 1) * 100:.1f}% above their season average.")
@@ -518,9 +533,7 @@ def get_performance_insights(player_stats, player_name):
         insights.append(f"📉 {player_name} is in a scoring slump, averaging only {last_5_pts_avg:.1f} points in the last 5 games, which is {(1 - (last_5_pts_avg / season_pts_avg)) * 100:.1f}% below their season average.")
     
     # Check for consistency
-    pts_std = player_stats['PTS'].std()
-    pts_mean = player_stats['PTS'].mean()
-    pts_cv = pts_std / pts_mean  # Coefficient of variation
+    pts_cv = pts_std / season_pts_avg  # Coefficient of variation
     
     if pts_cv < 0.2:
         insights.append(f"📊 {player_name} shows remarkable consistency in scoring, with a standard deviation of only {pts_std:.1f} points.")
@@ -528,15 +541,14 @@ def get_performance_insights(player_stats, player_name):
         insights.append(f"📊 {player_name}'s scoring has been inconsistent, with a high standard deviation of {pts_std:.1f} points.")
     
     # Check for best and worst games
-    best_game = player_stats.loc[player_stats['PTS'].idxmax()]
-    worst_game = player_stats.loc[player_stats['PTS'].idxmin()]
+    best_game = player_stats.loc[best_idx]
+    worst_game = player_stats.loc[worst_idx]
     
-    insights.append(f"🌟 Best scoring game: {best_game['PTS']} points against {best_game['MATCHUP']} on {best_game['GAME_DATE'].strftime('%b %d, %Y')}.")
-    insights.append(f"⬇️ Lowest scoring game: {worst_game['PTS']} points against {worst_game['MATCHUP']} on {worst_game['GAME_DATE'].strftime('%b %d, %Y')}.")
+    insights.append(f"🌟 Best scoring game: {best_game['PTS']} points against {best_game['MATCHUP']} on {best_game['GAME_DATE_STR']}.")
+    insights.append(f"⬇️ Lowest scoring game: {worst_game['PTS']} points against {worst_game['MATCHUP']} on {worst_game['GAME_DATE_STR']}.")
     
     # Check shooting percentages
-    fg_pct_avg = player_stats['FG_PCT'].mean() * 100
-    fg3_pct_avg = player_stats['FG3_PCT'].mean() * 100
+    fg_pct_avg, fg3_pct_avg = player_stats[['FG_PCT', 'FG3_PCT']].mean() * 100
     
     if fg_pct_avg > 50:
         insights.append(f"🎯 {player_name} has been highly efficient, shooting {fg_pct_avg:.1f}% from the field this season.")
@@ -548,6 +560,122 @@ def get_performance_insights(player_stats, player_name):
     
     return insights
 
+def render_scoring_view(player_stats, player_name, rolling_window, season_avgs, selected_stat):
+    """Render the scoring trend and distribution charts"""
+    # Points trend
+    st.plotly_chart(
+        create_performance_line_chart(
+            player_stats, 
+            'PTS', 
+            f"{player_name} - Points Trend", 
+            rolling_window,
+            season_avg=season_avgs['PTS']
+        ),
+        use_container_width=True
+    )
+    
+    # Points distribution
+    st.plotly_chart(
+        create_stat_distribution_chart(
+            player_stats, 
+            'PTS', 
+            f"{player_name} - Points Distribution",
+            mean_value=season_avgs['PTS']
+        ),
+        use_container_width=True
+    )
+
+def render_efficiency_view(player_stats, player_name, rolling_window, season_avgs, selected_stat):
+    """Render the shooting efficiency and plus/minus charts"""
+    # Shooting percentages
+    st.plotly_chart(
+        create_shooting_chart(
+            player_stats, 
+            f"{player_name} - Shooting Efficiency"
+        ),
+        use_container_width=True
+    )
+    
+    # Efficiency metrics by game
+    st.plotly_chart(
+        create_performance_line_chart(
+            player_stats, 
+            'PLUS_MINUS', 
+            f"{player_name} - Plus/Minus", 
+            rolling_window,
+            season_avg=season_avgs['PLUS_MINUS']
+        ),
+        use_container_width=True
+    )
+
+def render_all_around_view(player_stats, player_name, rolling_window, season_avgs, selected_stat):
+    """Render the performance radar and selected stat trend"""
+    # Radar chart for all-around game
+    st.plotly_chart(
+        create_radar_chart(
+            player_stats, 
+            RADAR_STATS, 
+            f"{player_name} - Performance Profile"
+        ),
+        use_container_width=True
+    )
+    
+    # Selected stat trend
+    if selected_stat not in ['PTS', 'PLUS_MINUS']:  # Don't show duplicates
+        st.plotly_chart(
+            create_performance_line_chart(
+                player_stats, 
+                selected_stat, 
+                f"{player_name} - {selected_stat} Trend", 
+                rolling_window,
+                season_avg=season_avgs[selected_stat]
+            ),
+            use_container_width=True
+        )
+
+# Performance trend views; only the selected one is built on each run
+PERFORMANCE_VIEWS = {
+    "Scoring": render_scoring_view,
+    "Efficiency": render_efficiency_view,
+    "All-Around Game": render_all_around_view,
+}
+
+# Player header card with the current season averages
+PLAYER_CARD_TEMPLATE = """
+<div class='card'>
+    <h3>{name}</h3>
+    <p>{team} | Position: {position}</p>
+    <p>Season: {season}</p>
+    <hr>
+    <div style='display: flex; justify-content: space-between;'>
+        <div class='stat-card'>
+            <div class='stat-value'>{pts}</div>
+            <div class='stat-label'>PPG</div>
+        </div>
+        <div class='stat-card'>
+            <div class='stat-value'>{reb}</div>
+            <div class='stat-label'>RPG</div>
+        </div>
+        <div class='stat-card'>
+            <div class='stat-value'>{ast}</div>
+            <div class='stat-label'>APG</div>
+        </div>
+        <div class='stat-card'>
+            <div class='stat-value'>{per}</div>
+            <div class='stat-label'>PER</div>
+        </div>
+    </div>
+</div>
+"""
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _player_card_html(name, team, position, season, pts, reb, ast, per):
+    """Render the player header card HTML"""
+    return PLAYER_CARD_TEMPLATE.format(
+        name=name, team=team, position=position, season=season,
+        pts=pts, reb=reb, ast=ast, per=per
+    )
+
 def main():
     st.markdown('<div class="page-title">Player Performance Dashboard</div>', unsafe_allow_html=True)
     
@@ -562,24 +690,20 @@ def main():
     
     # Get player list (from database or sample)
     players = get_sample_players()
-    player_options = [p["name"] for p in players]
     
     # Select player
-    selected_player_name = st.sidebar.selectbox("Select Player", player_options)
-    selected_player = next((p for p in players if p["name"] == selected_player_name), None)
+    selected_player_name = st.sidebar.selectbox("Select Player", players.index.tolist())
     
-    if not selected_player:
+    if selected_player_name not in players.index:
         st.error("No player selected. Please select a player from the sidebar.")
         return
     
+    selected_player = players.loc[selected_player_name]
+    
     # Display season selection
     current_year = datetime.now().year
     seasons = [f"{year-1}-{str(year)[2:]}" for year in range(current_year-2, current_year+1)]
     
-    # Check if season has changed
-    if 'previous_season' not in st.session_state:
-        st.session_state.previous_season = seasons[-1]  # Default to most recent season
-        
     selected_season = st.sidebar.selectbox("Select Season", seasons, index=len(seasons)-1)
     
     # Add a button to clear cache and reload data
@@ -589,12 +713,6 @@ def main():
         get_player_season_stats.clear()
         st.sidebar.success("Data cache cleared! New data will be loaded.")
     
-    # Check if season changed and clear cache automatically
-    if st.session_state.previous_season != selected_season:
-        get_player_game_stats.clear()
-        get_player_season_stats.clear()
-        st.session_state.previous_season = selected_season
-    
     # Statistic selection for charts
     stat_options = ["PTS", "AST", "REB", "STL", "BLK", "TOV", "PLUS_MINUS"]
     selected_stat = st.sidebar.selectbox("Select Statistic for Analysis", stat_options, index=0)
@@ -610,44 +728,41 @@ def main():
         player_game_stats = get_player_game_stats(selected_player["id"], selected_season)
         player_season_stats = get_player_season_stats(selected_player["id"])
     
+    # Sort once so every chart can use the game log in date order
+    player_game_stats = player_game_stats.sort_values('GAME_DATE').reset_index(drop=True)
+    
+    # Season averages shared by every chart instead of recomputing per chart
+    season_avgs = player_game_stats[stat_options].mean()
+    
     # Player header section
     col1, col2 = st.columns([1, 3])
     
     with col1:
-        # Player image (would be replaced with actual player images in production)
-        st.image(f"https://cdn.nba.com/headshots/nba/latest/1040x760/{selected_player['id']}.png", 
-                width=200, caption=selected_player_name)
+        # Player image, falling back to the CDN URL if the thumbnail can't be fetched
+        try:
+            headshot = get_player_headshot(selected_player['id'])
+        except (requests.RequestException, OSError) as e:
+            module_logger.warning(f"Could not fetch headshot for {selected_player_name}: {e}")
+            headshot = HEADSHOT_URL.format(player_id=selected_player['id'])
+        st.image(headshot, width=200, caption=selected_player_name)
     
     with col2:
         # Player info and current season stats
         current_season_stats = player_season_stats.iloc[-1]  # Most recent season
         
-        st.markdown(f"""
-        <div class='card'>
-            <h3>{selected_player_name}</h3>
-            <p>{selected_player['team']} | Position: {selected_player['position']}</p>
-            <p>Season: {selected_season}</p>
-            <hr>
-            <div style='display: flex; justify-content: space-between;'>
-                <div class='stat-card'>
-                    <div class='stat-value'>{current_season_stats['PTS']}</div>
-                    <div class='stat-label'>PPG</div>
-                </div>
-                <div class='stat-card'>
-                    <div class='stat-value'>{current_season_stats['REB']}</div>
-                    <div class='stat-label'>RPG</div>
-                </div>
-                <div class='stat-card'>
-                    <div class='stat-value'>{current_season_stats['AST']}</div>
-                    <div class='stat-label'>APG</div>
-                </div>
-                <div class='stat-card'>
-                    <div class='stat-value'>{current_season_stats['PER']}</div>
-                    <div class='stat-label'>PER</div>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(
+            _player_card_html(
+                selected_player_name,
+                selected_player['team'],
+                selected_player['position'],
+                selected_season,
+                current_season_stats['PTS'],
+                current_season_stats['REB'],
+                current_season_stats['AST'],
+                current_season_stats['PER']
+            ),
+            unsafe_allow_html=True
+        )
     
     # Performance insights
     st.markdown('<div class="section-title">Performance Insights</div>', unsafe_allow_html=True)
@@ -660,73 +775,20 @@ def main():
     # Performance Trend Tab
     st.markdown('<div class="section-title">Performance Trends</div>', unsafe_allow_html=True)
     
-    performance_tabs = st.tabs(["Scoring", "Efficiency", "All-Around Game"])
-    
-    with performance_tabs[0]:
-        # Points trend
-        st.plotly_chart(
-            create_performance_line_chart(
-                player_game_stats, 
-                'PTS', 
-                f"{selected_player_name} - Points Trend", 
-                rolling_window
-            ),
-            use_container_width=True
-        )
-        
-        # Points distribution
-        st.plotly_chart(
-            create_stat_distribution_chart(
-                player_game_stats, 
-                'PTS', 
-                f"{selected_player_name} - Points Distribution"
-            ),
-            use_container_width=True
-        )
-    
-    with performance_tabs[1]:
-        # Shooting percentages
-        st.plotly_chart(
-            create_shooting_chart(
-                player_game_stats, 
-                f"{selected_player_name} - Shooting Efficiency"
-            ),
-            use_container_width=True
-        )
-        
-        # Efficiency metrics by game
-        st.plotly_chart(
-            create_performance_line_chart(
-                player_game_stats, 
-                'PLUS_MINUS', 
-                f"{selected_player_name} - Plus/Minus", 
-                rolling_window
-            ),
-            use_container_width=True
-        )
-    
-    with performance_tabs[2]:
-        # Radar chart for all-around game
-        st.plotly_chart(
-            create_radar_chart(
-                player_game_stats, 
-                ['PTS', 'AST', 'REB', 'STL', 'BLK', 'FG_PCT', 'FG3_PCT'], 
-                f"{selected_player_name} - Performance Profile"
-            ),
-            use_container_width=True
-        )
-        
-        # Selected stat trend
-        if selected_stat not in ['PTS', 'PLUS_MINUS']:  # Don't show duplicates
-            st.plotly_chart(
-                create_performance_line_chart(
-                    player_game_stats, 
-                    selected_stat, 
-                    f"{selected_player_name} - {selected_stat} Trend", 
-                    rolling_window
-                ),
-                use_container_width=True
-            )
+    selected_view = st.radio(
+        "Performance View",
+        list(PERFORMANCE_VIEWS),
+        horizontal=True,
+        label_visibility="collapsed",
+        key="performance_view"
+    )
+    PERFORMANCE_VIEWS[selected_view](
+        player_game_stats,
+        selected_player_name,
+        rolling_window,
+        season_avgs,
+        selected_stat
+    )
     
     # Season comparison
     st.markdown('<div class="section-title">Season Comparison</div>', unsafe_allow_html=True)
@@ -739,22 +801,16 @@ def main():
     )
     
     # Season comparison chart
-    season_stats = player_season_stats[['SEASON', 'PTS', 'AST', 'REB']]
-    season_stats_melted = pd.melt(season_stats, id_vars=['SEASON'], value_vars=['PTS', 'AST', 'REB'])
-    
-    fig = px.bar(
-        season_stats_melted, 
-        x='SEASON', 
-        y='value', 
-        color='variable',
-        barmode='group',
-        labels={'value': 'Average', 'variable': 'Statistic'},
-        title=f"{selected_player_name} - Season Comparison",
-        color_discrete_sequence=px.colors.qualitative.Bold
+    st.plotly_chart(
+        create_season_comparison_chart(
+            player_season_stats,
+            f"{selected_player_name} - Season Comparison"
+        ),
+        use_container_width=True
     )
     
-    fig.update_layout(template='plotly_white')
-    st.plotly_chart(fig, use_container_width=True)
+    # Load the neighbouring seasons in the background so switching season is a cache hit
+    prefetch_adjacent_seasons(selected_player['id'], seasons, selected_season)
     
     # Log page view
     module_logger.info(f"User viewed Player Dashboard for {selected_player_name}")
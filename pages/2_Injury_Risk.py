@@ -5,39 +5,19 @@ Provides insights on player workload and injury risk assessment
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import os
-import sys
-import time
-from datetime import datetime, timedelta
+import string
 
-# Add the parent directory to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+# Import utilities and modules (requires the sportsiq package, see `pip install -e .`)
+from sportsiq.utils import setup_logging, get_logger, test_connection, execute_query
+from sportsiq.utils.style import apply_light_mode
 
-# Import utilities and modules
-try:
-    from sportsiq.utils import setup_logging, get_logger, test_connection, execute_query
-    from sportsiq.utils.style import apply_light_mode
-except ImportError:
-    # If import fails, create placeholder functions
-    import logging
-    logging.basicConfig(level=logging.INFO)
-    def setup_logging():
-        return logging.getLogger("injury_risk")
-    def get_logger(name):
-        return logging.getLogger(name)
-    def test_connection():
-        return True
-    def execute_query(query, params=None):
-        return []
-    def apply_light_mode():
-        pass
+# Set up logging once per process so reruns don't rebuild the handlers
+@st.cache_resource(show_spinner=False)
+def _init_logging():
+    """Configure logging and return the root and page loggers"""
+    return setup_logging(), get_logger("injury_risk")
 
-# Set up logging
-logger = setup_logging()
-module_logger = get_logger("injury_risk")
+logger, module_logger = _init_logging()
 
 # Set page configuration
 st.set_page_config(
@@ -51,7 +31,10 @@ st.set_page_config(
 apply_light_mode()
 
 # Custom CSS for this page only
-st.markdown("""
+@st.cache_resource
+def _css_blob():
+    """Return the page CSS, built once per process"""
+    return """
 <style>
     .page-title {
         font-size: 2rem;
@@ -108,7 +91,9 @@ st.markdown("""
         margin-bottom: 1rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(_css_blob(), unsafe_allow_html=True)
 
 # Sample data functions (would be replaced by real database queries)
 @st.cache_data(ttl=3600)  # Cache for 1 hour
@@ -127,89 +112,110 @@ def get_sample_players():
         {"id": 1627783, "name": "Donovan Mitchell", "team": "Cleveland Cavaliers", "position": "G", "age": 27}
     ]
 
+# Opponents cycled through for the sample game logs
+_OPPONENTS = np.array(["BOS", "MIA", "PHI", "TOR", "CHI", "CLE", "MIL", "NYK", "ATL", "CHA",
+                       "LAL", "GSW", "PHX", "LAC", "DEN", "MEM", "DAL", "POR", "UTA", "SAC"])
+# Matchups are stored as a categorical column keyed on the opponent list
+MATCHUP_DTYPE = pd.CategoricalDtype(np.char.add("vs. ", _OPPONENTS))
+
+def compute_fatigue_scores(minutes, days_rest, games_last_7_days, usage_pct, minutes_last_7_days):
+    """
+    Compute fatigue scores and injury risk probabilities from workload arrays.
+    
+    Inputs may be arrays of any matching shape, so a whole league of
+    (players, games) workloads can be scored in one call.
+    
+    Returns:
+        tuple: (fatigue_score, risk_probability) float arrays
+    """
+    # Formula: weighted sum of factors that contribute to fatigue (more complex in reality)
+    fatigue_score = (
+        (np.asarray(minutes) / 48) * 35 +  # Minutes contribution (max 35 points)
+        np.minimum(10, 10 - np.asarray(days_rest) * 2) +  # Recent rest contribution (max 10 points)
+        (np.asarray(games_last_7_days) / 5) * 20 +  # Games density contribution (max 20 points)
+        (np.asarray(usage_pct) / 40) * 25 +  # Usage rate contribution (max 25 points)
+        (np.asarray(minutes_last_7_days) / 240) * 10  # 7-day workload contribution (max 10 points)
+    )
+    
+    # Injury risk probability is a logistic function of the fatigue score
+    risk_probability = 1 / (1 + np.exp(-0.05 * (fatigue_score - 50)))
+    
+    return fatigue_score, risk_probability
+
 @st.cache_data(ttl=3600)  # Cache for 1 hour
-def get_player_fatigue_metrics(player_id):
-    """Generate sample fatigue metrics for a player"""
-    np.random.seed(player_id)  # Use player ID as seed for consistency
+def get_player_fatigue_metrics(player_id, n_games=30):
+    """Generate sample fatigue metrics for a player, ordered oldest to newest game"""
+    rng = np.random.default_rng(player_id)  # Use player ID as seed for consistency
     
     # Create dates for the last 30 games
-    end_date = datetime.now() - timedelta(days=2)
-    game_dates = [end_date - timedelta(days=i*2) for i in range(30)]
-    game_dates.reverse()  # Oldest to newest
+    end_date = pd.Timestamp.now().normalize() - pd.Timedelta(days=2)
+    game_dates = pd.date_range(end=end_date, periods=n_games, freq='2D')  # Oldest to newest
+    game_days = game_dates.values.astype('datetime64[D]').astype(np.int64)
+    game_index = np.arange(n_games)
     
     # Base values
-    base_minutes = np.random.randint(28, 35)
-    base_usage = np.random.randint(24, 32)
-    
-    # Generate metrics
-    metrics = []
-    
-    # Initialize variables for calculating cumulative metrics
-    last_game_date = None
-    
-    for i, game_date in enumerate(game_dates):
-        # Minutes played with some randomness
-        minutes = max(20, min(40, base_minutes + np.random.randint(-6, 7)))
-        
-        # Days of rest since last game
-        days_rest = (game_date - last_game_date).days if last_game_date else 3
-        last_game_date = game_date
-        
-        # Count games in last 7 days
-        games_last_7_days = sum(1 for d in game_dates[max(0, i-7):i+1] 
-                               if (game_date - d).days <= 7)
-        
-        # Calculate minutes in last 7 days
-        minutes_last_7_days = sum(np.random.randint(base_minutes-5, base_minutes+6) 
-                                 for _ in range(games_last_7_days))
-        
-        # Usage rate (with trend - slightly increasing over time to simulate fatigue)
-        usage_pct = base_usage + np.random.randint(-3, 4) + (i // 10)
-        usage_pct = min(45, max(15, usage_pct))  # Keep within reasonable bounds
-        
-        # Create 5-game rolling average for minutes
-        if i >= 4:
-            min_rolling_avg_5 = sum(metrics[j]['MINUTES'] for j in range(i-4, i)) / 4
-        else:
-            min_rolling_avg_5 = base_minutes
-        
-        # Calculate fatigue score (more complex in reality)
-        # Formula: weighted sum of factors that contribute to fatigue
-        fatigue_score = (
-            (minutes / 48) * 35 +  # Minutes contribution (max 35 points)
-            (min(10, 10 - days_rest*2)) +  # Recent rest contribution (max 10 points)
-            (games_last_7_days / 5) * 20 +  # Games density contribution (max 20 points)
-            (usage_pct / 40) * 25 +  # Usage rate contribution (max 25 points)
-            (minutes_last_7_days / 240) * 10  # 7-day workload contribution (max 10 points)
-        )
-        
-        # Add injury risk probability (logistic function of fatigue score)
-        risk_probability = 1 / (1 + np.exp(-0.05 * (fatigue_score - 50)))
-        
-        # Create opponent from list of teams
-        teams = ["BOS", "MIA", "PHI", "TOR", "CHI", "CLE", "MIL", "NYK", "ATL", "CHA", 
-                "LAL", "GSW", "PHX", "LAC", "DEN", "MEM", "DAL", "POR", "UTA", "SAC"]
-        opponent = teams[i % len(teams)]
-        
-        metrics.append({
-            "GAME_DATE": game_date,
-            "MATCHUP": f"vs. {opponent}",
-            "MINUTES": minutes,
-            "DAYS_REST": days_rest,
-            "GAMES_LAST_7_DAYS": games_last_7_days,
-            "MINUTES_LAST_7_DAYS": minutes_last_7_days,
-            "USAGE_PCT": usage_pct,
-            "MIN_ROLLING_AVG_5": min_rolling_avg_5,
-            "FATIGUE_SCORE": fatigue_score,
-            "RISK_PROBABILITY": risk_probability
-        })
+    base_minutes = rng.integers(28, 35)
+    base_usage = rng.integers(24, 32)
+    
+    # Minutes played with some randomness
+    minutes = np.clip(base_minutes + rng.integers(-6, 7, size=n_games), 20, 40)
+    
+    # Days of rest since last game
+    days_rest = np.concatenate([[3], np.diff(game_days)])
     
-    return pd.DataFrame(metrics)
+    # Count games in last 7 days (looking back at most 7 previous games)
+    window_start = np.maximum(np.searchsorted(game_days, game_days - 7, side='left'), game_index - 7)
+    games_last_7_days = game_index - window_start + 1
+    
+    # Calculate minutes in last 7 days (one draw per game in the window, up to 8 games)
+    draws = rng.integers(base_minutes - 5, base_minutes + 6, size=(n_games, 8))
+    window_mask = np.arange(8) < games_last_7_days[:, None]
+    minutes_last_7_days = (draws * window_mask).sum(axis=1)
+    
+    # Usage rate (with trend - slightly increasing over time to simulate fatigue)
+    usage_pct = base_usage + rng.integers(-3, 4, size=n_games) + (game_index // 10)
+    usage_pct = np.clip(usage_pct, 15, 45)  # Keep within reasonable bounds
+    
+    # Average minutes over the previous 4 games (base minutes until enough history)
+    min_rolling_avg_5 = np.concatenate([
+        np.full(min(4, n_games), base_minutes, dtype=float),
+        np.convolve(minutes, np.ones(4) / 4, mode='valid')[:max(0, n_games - 4)]
+    ])
+    
+    # Calculate fatigue score and injury risk probability
+    fatigue_score, risk_probability = compute_fatigue_scores(
+        minutes, days_rest, games_last_7_days, usage_pct, minutes_last_7_days
+    )
+    
+    # Create matchups by cycling through the list of teams
+    matchups = pd.Categorical.from_codes(game_index % len(_OPPONENTS), dtype=MATCHUP_DTYPE)
+    
+    return pd.DataFrame({
+        "GAME_DATE": game_dates,
+        "MATCHUP": matchups,
+        "MINUTES": minutes,
+        "DAYS_REST": days_rest,
+        "GAMES_LAST_7_DAYS": games_last_7_days,
+        "MINUTES_LAST_7_DAYS": minutes_last_7_days,
+        "USAGE_PCT": usage_pct,
+        "MIN_ROLLING_AVG_5": min_rolling_avg_5,
+        "FATIGUE_SCORE": fatigue_score,
+        "RISK_PROBABILITY": risk_probability
+    }).convert_dtypes(dtype_backend='pyarrow')
 
-def create_fatigue_trend_chart(fatigue_metrics, player_name):
+# Fatigue score zones: (lower bound, upper bound, RGB color, label)
+RISK_ZONES = (
+    (70, 100, "231, 76, 60", "High Risk"),
+    (40, 70, "241, 196, 15", "Moderate Risk"),
+    (0, 40, "46, 204, 113", "Low Risk"),
+)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def create_fatigue_trend_chart(player_id, player_name):
     """Create a line chart showing fatigue trends over time"""
-    # Sort by date
-    fatigue_metrics = fatigue_metrics.sort_values('GAME_DATE')
+    import plotly.graph_objects as go
+    
+    fatigue_metrics = get_player_fatigue_metrics(player_id)
     
     # Create figure
     fig = go.Figure()
@@ -226,68 +232,24 @@ def create_fatigue_trend_chart(fatigue_metrics, player_name):
         )
     )
     
-    # Add risk zones
-    fig.add_shape(
-        type="rect",
-        x0=fatigue_metrics['GAME_DATE'].min(),
-        x1=fatigue_metrics['GAME_DATE'].max(),
-        y0=70,
-        y1=100,
-        fillcolor="rgba(231, 76, 60, 0.2)",
-        line_width=0,
-        layer="below"
-    )
-    
-    fig.add_shape(
-        type="rect",
-        x0=fatigue_metrics['GAME_DATE'].min(),
-        x1=fatigue_metrics['GAME_DATE'].max(),
-        y0=40,
-        y1=70,
-        fillcolor="rgba(241, 196, 15, 0.2)",
-        line_width=0,
-        layer="below"
-    )
-    
-    fig.add_shape(
-        type="rect",
-        x0=fatigue_metrics['GAME_DATE'].min(),
-        x1=fatigue_metrics['GAME_DATE'].max(),
-        y0=0,
-        y1=40,
-        fillcolor="rgba(46, 204, 113, 0.2)",
-        line_width=0,
-        layer="below"
-    )
-    
-    # Add labels for risk zones
-    fig.add_annotation(
-        x=fatigue_metrics['GAME_DATE'].max(),
-        y=85,
-        text="High Risk",
-        showarrow=False,
-        font=dict(color="rgba(231, 76, 60, 1)", size=12)
-    )
-    
-    fig.add_annotation(
-        x=fatigue_metrics['GAME_DATE'].max(),
-        y=55,
-        text="Moderate Risk",
-        showarrow=False,
-        font=dict(color="rgba(241, 196, 15, 1)", size=12)
-    )
-    
-    fig.add_annotation(
-        x=fatigue_metrics['GAME_DATE'].max(),
-        y=20,
-        text="Low Risk",
-        showarrow=False,
-        font=dict(color="rgba(46, 204, 113, 1)", size=12)
-    )
+    # Add risk zones and their labels
+    xmin, xmax = fatigue_metrics['GAME_DATE'].iat[0], fatigue_metrics['GAME_DATE'].iat[-1]
+    shapes = [
+        dict(type="rect", x0=xmin, x1=xmax, y0=y0, y1=y1, fillcolor=f"rgba({rgb}, 0.2)",
+             line_width=0, layer="below")
+        for y0, y1, rgb, _ in RISK_ZONES
+    ]
+    annotations = [
+        dict(x=xmax, y=(y0 + y1) / 2, text=label, showarrow=False,
+             font=dict(color=f"rgba({rgb}, 1)", size=12))
+        for y0, y1, rgb, label in RISK_ZONES
+    ]
     
     # Set layout
     fig.update_layout(
         title=f"{player_name} - Fatigue Score Trend",
+        shapes=shapes,
+        annotations=annotations,
         xaxis_title="Game Date",
         yaxis_title="Fatigue Score",
         yaxis=dict(range=[0, 100]),
@@ -297,10 +259,13 @@ def create_fatigue_trend_chart(fatigue_metrics, player_name):
     
     return fig
 
-def create_workload_chart(fatigue_metrics, player_name):
+@st.cache_data(ttl=3600, show_spinner=False)
+def create_workload_chart(player_id, player_name):
     """Create a chart showing workload factors over time"""
-    # Sort by date
-    fatigue_metrics = fatigue_metrics.sort_values('GAME_DATE')
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    
+    fatigue_metrics = get_player_fatigue_metrics(player_id)
     
     # Create subplots with 3 rows
     fig = make_subplots(
@@ -384,100 +349,141 @@ def create_workload_chart(fatigue_metrics, player_name):
     
     return fig
 
-def create_risk_gauge(risk_probability, title="Current Injury Risk"):
-    """Create a gauge chart to visualize injury risk"""
+# Risk probability thresholds and the (level, color, CSS class, icon) for each band they delimit
+RISK_THRESHOLDS = np.array([0.3, 0.6])
+RISK_LEVELS = (
+    ("Low", "#4CAF50", "risk-low", "✅"),  # Green for low risk
+    ("Moderate", "#FFC107", "risk-medium", "⚠️"),  # Amber for moderate risk
+    ("High", "#F44336", "risk-high", "⚠️"),  # Red for high risk
+)
+
+def classify_risk(risk_probability):
+    """Look up the (level, color, CSS class, icon) band for a risk probability"""
+    return RISK_LEVELS[int(np.searchsorted(RISK_THRESHOLDS, risk_probability, side='right'))]
+
+# Semicircular gauge arc; pathLength="100" lets dash lengths be given in percent
+GAUGE_ARC = '<path d="M 10,100 A 90,90 0 0,1 190,100" pathLength="100" fill="none" stroke-width="18" {}/>'
+
+@st.cache_data(show_spinner=False)
+def create_risk_gauge_svg(risk_pct, title="Current Injury Risk"):
+    """Create an SVG gauge to visualize injury risk (risk_pct is a whole percentage)"""
     # Determine color based on risk level
-    if risk_probability < 0.3:
-        color = "#4CAF50"  # Green for low risk
-        risk_level = "Low"
-    elif risk_probability < 0.6:
-        color = "#FFC107"  # Amber for moderate risk
-        risk_level = "Moderate"
-    else:
-        color = "#F44336"  # Red for high risk
-        risk_level = "High"
-    
-    # Create gauge chart
-    fig = go.Figure(go.Indicator(
-        mode="gauge+number",
-        value=risk_probability * 100,  # Convert to percentage
-        title={"text": title, "font": {"size": 16}},
-        number={"suffix": "%", "font": {"color": color, "size": 20}},
-        gauge={
-            "axis": {"range": [0, 100], "tickwidth": 1, "tickcolor": "darkgray"},
-            "bar": {"color": color},
-            "bgcolor": "white",
-            "borderwidth": 2,
-            "bordercolor": "gray",
-            "steps": [
-                {"range": [0, 30], "color": "rgba(76, 175, 80, 0.3)"},  # Green zone
-                {"range": [30, 60], "color": "rgba(255, 193, 7, 0.3)"},  # Amber zone
-                {"range": [60, 100], "color": "rgba(244, 67, 54, 0.3)"}  # Red zone
-            ],
-            "threshold": {
-                "line": {"color": "black", "width": 3},
-                "thickness": 0.75,
-                "value": risk_probability * 100
-            }
-        }
-    ))
+    risk_level, color, _, _ = classify_risk(risk_pct / 100)
+    
+    # Background zones for each risk level
+    bounds = np.concatenate([[0], RISK_THRESHOLDS * 100, [100]])
+    zones = "".join(
+        GAUGE_ARC.format(f'stroke="{zone_color}" stroke-opacity="0.3" '
+                         f'stroke-dasharray="{hi - lo:g} 100" stroke-dashoffset="{-lo:g}"')
+        for lo, hi, (_, zone_color, _, _) in zip(bounds[:-1], bounds[1:], RISK_LEVELS)
+    )
     
-    # Update layout
-    fig.update_layout(
-        height=250,
-        margin=dict(l=20, r=20, t=50, b=20),
+    # Value bar and threshold tick at the current risk
+    bar = GAUGE_ARC.format(f'stroke="{color}" stroke-dasharray="{risk_pct} 100"')
+    angle = np.pi * risk_pct / 100
+    x1, y1 = 100 - 78 * np.cos(angle), 100 - 78 * np.sin(angle)
+    x2, y2 = 100 - 102 * np.cos(angle), 100 - 102 * np.sin(angle)
+    tick = f'<line x1="{x1:.1f}" y1="{y1:.1f}" x2="{x2:.1f}" y2="{y2:.1f}" stroke="black" stroke-width="3"/>'
+    
+    svg = (
+        f'<svg viewBox="-5 -5 210 135" style="width: 100%; max-width: 260px;" role="img" aria-label="{title}: {risk_pct}%">'
+        f'{zones}{bar}{tick}'
+        f'<text x="100" y="92" text-anchor="middle" font-size="26" font-weight="bold" fill="{color}">{risk_pct}%</text>'
+        f'<text x="100" y="125" text-anchor="middle" font-size="16" fill="#333">{title}</text>'
+        '</svg>'
     )
     
-    return fig, risk_level
+    return f"<div style='text-align: center;'>{svg}</div>", risk_level
 
-def get_risk_insights(fatigue_metrics, player_name, player_age):
-    """Generate insights based on fatigue metrics and risk assessment"""
-    insights = []
-    
-    # Get latest metrics
-    latest_metrics = fatigue_metrics.sort_values('GAME_DATE', ascending=False).iloc[0]
-    recent_metrics = fatigue_metrics.sort_values('GAME_DATE', ascending=False).head(5)
+# Workload insight rules: each fires when its value exceeds its threshold.
+# Values are (5-game avg minutes, 5-game avg minutes, games in 7 days, -days rest,
+# usage %, age, 10-game fatigue ratio); rest is negated so fewer days trips its rule.
+INSIGHT_THRESHOLDS = np.array([36, 32, 3, -2, 30, 32, 1.2])
+INSIGHT_TEMPLATES = (
+    "⏱️ {name} is playing {avg_minutes:.1f} minutes per game in the last 5 games, which is substantially above the recommended limit.",
+    "⏱️ {name} is playing {avg_minutes:.1f} minutes per game in the last 5 games, which is on the higher end but manageable.",
+    "📅 {name} has played {games} games in the last 7 days, indicating high schedule density and limited recovery time.",
+    "😴 {name} has had only {rest} day(s) of rest before the most recent game. Insufficient rest increases injury risk.",
+    "📊 {name}'s usage rate of {usage:.1f}% is very high, putting additional strain on their body.",
+    "👴 At {age} years old, {name} has increased recovery needs. The current workload should be carefully managed.",
+    "📈 {name}'s fatigue score has increased by {trend_pct:.1f}% over the last 10 games, suggesting accumulating fatigue.",
+)
+
+def extract_insight_metrics(fatigue_metrics, player_age):
+    """Pull the quantized scalars the risk insights depend on"""
+    # Fatigue metrics are ordered oldest to newest
+    latest_metrics = fatigue_metrics.iloc[-1]
+    recent_trend = fatigue_metrics['FATIGUE_SCORE'].to_numpy()[-10:]
+    
+    return (
+        round(float(latest_metrics['RISK_PROBABILITY']), 3),
+        round(float(fatigue_metrics['MINUTES'].to_numpy()[-5:].mean()), 1),
+        int(latest_metrics['GAMES_LAST_7_DAYS']),
+        int(latest_metrics['DAYS_REST']),
+        float(latest_metrics['USAGE_PCT']),
+        int(player_age),
+        round(float(recent_trend[-1] / recent_trend[0]), 4),
+    )
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_risk_insights(player_name, insight_metrics):
+    """Generate insights from the quantized metrics returned by extract_insight_metrics"""
+    risk_prob, recent_avg_minutes, games_last_7_days, days_rest, usage_pct, player_age, trend_ratio = insight_metrics
     
     # Insight on current risk level
-    risk_prob = latest_metrics['RISK_PROBABILITY']
-    if risk_prob > 0.6:
-        insights.append(f"⚠️ {player_name} currently has a <span class='risk-high'>HIGH</span> injury risk probability of {risk_prob:.1%}.")
-    elif risk_prob > 0.3:
-        insights.append(f"⚠️ {player_name} currently has a <span class='risk-medium'>MODERATE</span> injury risk probability of {risk_prob:.1%}.")
-    else:
-        insights.append(f"✅ {player_name} currently has a <span class='risk-low'>LOW</span> injury risk probability of {risk_prob:.1%}.")
-    
-    # Insight on minutes load
-    recent_avg_minutes = recent_metrics['MINUTES'].mean()
-    if recent_avg_minutes > 36:
-        insights.append(f"⏱️ {player_name} is playing {recent_avg_minutes:.1f} minutes per game in the last 5 games, which is substantially above the recommended limit.")
-    elif recent_avg_minutes > 32:
-        insights.append(f"⏱️ {player_name} is playing {recent_avg_minutes:.1f} minutes per game in the last 5 games, which is on the higher end but manageable.")
-    
-    # Insight on game density
-    if latest_metrics['GAMES_LAST_7_DAYS'] >= 4:
-        insights.append(f"📅 {player_name} has played {latest_metrics['GAMES_LAST_7_DAYS']} games in the last 7 days, indicating high schedule density and limited recovery time.")
-    
-    # Insight on rest
-    if latest_metrics['DAYS_REST'] < 2:
-        insights.append(f"😴 {player_name} has had only {latest_metrics['DAYS_REST']} day(s) of rest before the most recent game. Insufficient rest increases injury risk.")
-    
-    # Insight on usage rate
-    if latest_metrics['USAGE_PCT'] > 30:
-        insights.append(f"📊 {player_name}'s usage rate of {latest_metrics['USAGE_PCT']:.1f}% is very high, putting additional strain on their body.")
-    
-    # Insight based on age
-    if player_age > 32:
-        insights.append(f"👴 At {player_age} years old, {player_name} has increased recovery needs. The current workload should be carefully managed.")
-    
-    # Insight on trend
-    recent_trend = fatigue_metrics.sort_values('GAME_DATE', ascending=True).tail(10)['FATIGUE_SCORE']
-    
-    if recent_trend.iloc[-1] > recent_trend.iloc[0] * 1.2:
-        insights.append(f"📈 {player_name}'s fatigue score has increased by {((recent_trend.iloc[-1] / recent_trend.iloc[0]) - 1) * 100:.1f}% over the last 10 games, suggesting accumulating fatigue.")
+    risk_level, _, risk_class, icon = classify_risk(risk_prob)
+    insights = [f"{icon} {player_name} currently has a <span class='{risk_class}'>{risk_level.upper()}</span> injury risk probability of {risk_prob:.1%}."]
+    
+    # Evaluate every workload rule at once
+    values = np.array([
+        recent_avg_minutes, recent_avg_minutes, games_last_7_days,
+        -days_rest, usage_pct, player_age, trend_ratio
+    ], dtype=float)
+    hits = values > INSIGHT_THRESHOLDS
+    hits[1] &= ~hits[0]  # Only the higher minutes tier is reported
+    
+    fields = {
+        "name": player_name,
+        "avg_minutes": recent_avg_minutes,
+        "games": games_last_7_days,
+        "rest": days_rest,
+        "usage": usage_pct,
+        "age": player_age,
+        "trend_pct": (trend_ratio - 1) * 100,
+    }
+    insights.extend(INSIGHT_TEMPLATES[i].format_map(fields) for i in np.flatnonzero(hits))
     
     return insights
 
+@st.cache_data(ttl=3600)
+def get_latest_and_insights(player_id, player_name, player_age):
+    """Get the most recent game's metrics and the risk insights for a player"""
+    fatigue_metrics = get_player_fatigue_metrics(player_id)
+    latest_metrics = fatigue_metrics.iloc[-1].to_dict()
+    insights = get_risk_insights(player_name, extract_insight_metrics(fatigue_metrics, player_age))
+    return latest_metrics, insights
+
+PLAYER_CARD_TEMPLATE = """
+<div class="card">
+    <h3>{name}</h3>
+    <p><strong>Team:</strong> {team} | <strong>Position:</strong> {position}</p>
+    <p><strong>Age:</strong> {age} | <strong>Last Game:</strong> {last_game}</p>
+    <p><strong>Current Risk Level:</strong> <span class="{risk_class}">{risk_level}</span></p>
+</div>
+"""
+
+# Repeated HTML fragments, parsed once at import
+INDICATOR_CARD_TEMPLATE = string.Template(
+    '<div class="indicator-card"$style><div class="indicator-value" style="color: $color;">$value</div>'
+    '<div class="indicator-label">$label</div></div>'
+)
+INSIGHT_BOX_TEMPLATE = string.Template("<div class='insight-box'>$insight</div>")
+
+def indicator_card_html(value, label, color, stacked=False):
+    """Build the HTML for a single risk indicator card"""
+    style = ' style="margin-top: 1rem;"' if stacked else ''
+    return INDICATOR_CARD_TEMPLATE.substitute(style=style, color=color, value=value, label=label)
+
 def main():
     st.markdown('<div class="page-title">Injury Risk Analysis</div>', unsafe_allow_html=True)
     
@@ -526,12 +532,12 @@ def main():
     # Current risk overview
     st.markdown('<div class="section-title">Current Risk Assessment</div>', unsafe_allow_html=True)
     
-    # Get latest metrics
-    latest_metrics = fatigue_metrics.sort_values('GAME_DATE', ascending=False).iloc[0]
+    # Get latest metrics and insights
+    latest_metrics, insights = get_latest_and_insights(selected_player["id"], selected_player_name, selected_player['age'])
     
     # Generate risk level information first
-    risk_gauge_fig, risk_level = create_risk_gauge(latest_metrics['RISK_PROBABILITY'], "Injury Risk")
-    risk_color_class = f"risk-{risk_level.lower()}"
+    risk_gauge_svg, risk_level = create_risk_gauge_svg(round(latest_metrics['RISK_PROBABILITY'] * 100), "Injury Risk")
+    risk_color_class = classify_risk(latest_metrics['RISK_PROBABILITY'])[2]
     
     # Add player image in a separate row above the risk indicators
     player_image_col1, player_image_col2 = st.columns([1, 3])
@@ -549,114 +555,88 @@ def main():
     
     with player_image_col2:
         # Player info card with more details
-        st.markdown(f"""
-        <div class="card">
-            <h3>{selected_player['name']}</h3>
-            <p><strong>Team:</strong> {selected_player['team']} | <strong>Position:</strong> {selected_player['position']}</p>
-            <p><strong>Age:</strong> {selected_player['age']} | <strong>Last Game:</strong> {latest_metrics['GAME_DATE'].strftime('%b %d, %Y')}</p>
-            <p><strong>Current Risk Level:</strong> <span class="{risk_color_class}">{risk_level}</span></p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(PLAYER_CARD_TEMPLATE.format_map({
+            **selected_player,
+            "last_game": latest_metrics['GAME_DATE'].strftime('%b %d, %Y'),
+            "risk_class": risk_color_class,
+            "risk_level": risk_level,
+        }), unsafe_allow_html=True)
     
     # Create columns for risk indicators
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        # Risk gauge - use the previously created figure
-        st.plotly_chart(risk_gauge_fig, use_container_width=True)
-        
-        # Risk level text with appropriate color
-        st.markdown(f"<div style='text-align: center;'>Risk Level: <span class='{risk_color_class}'>{risk_level}</span></div>", unsafe_allow_html=True)
+        # Risk gauge (previously created SVG) and risk level text with appropriate color
+        st.markdown(
+            risk_gauge_svg +
+            f"<div style='text-align: center;'>Risk Level: <span class='{risk_color_class}'>{risk_level}</span></div>",
+            unsafe_allow_html=True
+        )
     
     with col2:
-        # Fatigue score
-        st.markdown("""
-        <div class="indicator-card">
-            <div class="indicator-value" style="color: #E53935;">{:.1f}</div>
-            <div class="indicator-label">Fatigue Score</div>
-        </div>
-        """.format(latest_metrics['FATIGUE_SCORE']), unsafe_allow_html=True)
-        
-        # Recent workload
-        st.markdown("""
-        <div class="indicator-card" style="margin-top: 1rem;">
-            <div class="indicator-value" style="color: #FB8C00;">{}</div>
-            <div class="indicator-label">Minutes Last Game</div>
-        </div>
-        """.format(latest_metrics['MINUTES']), unsafe_allow_html=True)
+        # Fatigue score and recent workload
+        st.markdown(
+            indicator_card_html(f"{latest_metrics['FATIGUE_SCORE']:.1f}", "Fatigue Score", "#E53935") +
+            indicator_card_html(f"{latest_metrics['MINUTES']}", "Minutes Last Game", "#FB8C00", stacked=True),
+            unsafe_allow_html=True
+        )
     
     with col3:
-        # Game density
-        st.markdown("""
-        <div class="indicator-card">
-            <div class="indicator-value" style="color: #43A047;">{}</div>
-            <div class="indicator-label">Games in Last 7 Days</div>
-        </div>
-        """.format(latest_metrics['GAMES_LAST_7_DAYS']), unsafe_allow_html=True)
-        
-        # Rest days
-        st.markdown("""
-        <div class="indicator-card" style="margin-top: 1rem;">
-            <div class="indicator-value" style="color: #1E88E5;">{}</div>
-            <div class="indicator-label">Days Rest Before Last Game</div>
-        </div>
-        """.format(latest_metrics['DAYS_REST']), unsafe_allow_html=True)
+        # Game density and rest days
+        st.markdown(
+            indicator_card_html(f"{latest_metrics['GAMES_LAST_7_DAYS']}", "Games in Last 7 Days", "#43A047") +
+            indicator_card_html(f"{latest_metrics['DAYS_REST']}", "Days Rest Before Last Game", "#1E88E5", stacked=True),
+            unsafe_allow_html=True
+        )
     
     with col4:
-        # Usage information
-        st.markdown("""
-        <div class="indicator-card">
-            <div class="indicator-value" style="color: #9C27B0;">{:.1f}%</div>
-            <div class="indicator-label">Usage Percentage</div>
-        </div>
-        """.format(latest_metrics['USAGE_PCT']), unsafe_allow_html=True)
-        
-        # Minutes rolling average
-        st.markdown("""
-        <div class="indicator-card" style="margin-top: 1rem;">
-            <div class="indicator-value" style="color: #5E35B1;">{:.1f}</div>
-            <div class="indicator-label">Avg Minutes (Last 5 Games)</div>
-        </div>
-        """.format(latest_metrics['MIN_ROLLING_AVG_5']), unsafe_allow_html=True)
+        # Usage information and minutes rolling average
+        st.markdown(
+            indicator_card_html(f"{latest_metrics['USAGE_PCT']:.1f}%", "Usage Percentage", "#9C27B0") +
+            indicator_card_html(f"{latest_metrics['MIN_ROLLING_AVG_5']:.1f}", "Avg Minutes (Last 5 Games)", "#5E35B1", stacked=True),
+            unsafe_allow_html=True
+        )
     
     # Insights
     st.markdown('<div class="section-title">Risk Insights</div>', unsafe_allow_html=True)
     
-    insights = get_risk_insights(fatigue_metrics, selected_player_name, selected_player['age'])
-    
-    for insight in insights:
-        st.markdown(f"<div class='insight-box'>{insight}</div>", unsafe_allow_html=True)
+    st.markdown("".join(INSIGHT_BOX_TEMPLATE.substitute(insight=insight) for insight in insights), unsafe_allow_html=True)
     
     # Fatigue trend chart
     st.markdown('<div class="section-title">Fatigue Trend Analysis</div>', unsafe_allow_html=True)
     
     # Create fatigue trend chart
-    fatigue_chart = create_fatigue_trend_chart(fatigue_metrics, selected_player_name)
+    fatigue_chart = create_fatigue_trend_chart(selected_player["id"], selected_player_name)
     st.plotly_chart(fatigue_chart, use_container_width=True)
     
     # Workload analysis
     st.markdown('<div class="section-title">Workload Analysis</div>', unsafe_allow_html=True)
     
     # Create workload chart
-    workload_chart = create_workload_chart(fatigue_metrics, selected_player_name)
+    workload_chart = create_workload_chart(selected_player["id"], selected_player_name)
     st.plotly_chart(workload_chart, use_container_width=True)
     
     # Risk factors table
     st.markdown('<div class="section-title">Detailed Risk Factors</div>', unsafe_allow_html=True)
     
     # Filter columns and format date column
-    display_cols = ['GAME_DATE', 'MATCHUP', 'MINUTES', 'DAYS_REST', 'GAMES_LAST_7_DAYS', 
-                    'USAGE_PCT', 'FATIGUE_SCORE', 'RISK_PROBABILITY']
-    
-    display_df = fatigue_metrics[display_cols].sort_values('GAME_DATE', ascending=False).copy()
-    display_df['GAME_DATE'] = display_df['GAME_DATE'].dt.strftime('%b %d, %Y')
-    display_df['RISK_PROBABILITY'] = display_df['RISK_PROBABILITY'].apply(lambda x: f"{x:.1%}")
-    display_df['FATIGUE_SCORE'] = display_df['FATIGUE_SCORE'].apply(lambda x: f"{x:.1f}")
-    display_df['USAGE_PCT'] = display_df['USAGE_PCT'].apply(lambda x: f"{x:.1f}%")
-    
-    # Rename columns for display
-    display_df.columns = ['Game Date', 'Matchup', 'Minutes', 'Days Rest', 'Games in 7 Days', 
-                         'Usage %', 'Fatigue Score', 'Risk Probability']
+    display_columns = {
+        'GAME_DATE': 'Game Date', 'MATCHUP': 'Matchup', 'MINUTES': 'Minutes', 'DAYS_REST': 'Days Rest',
+        'GAMES_LAST_7_DAYS': 'Games in 7 Days', 'USAGE_PCT': 'Usage %', 'FATIGUE_SCORE': 'Fatigue Score',
+        'RISK_PROBABILITY': 'Risk Probability'
+    }
+    
+    # Newest game first; values keep their dtypes and are formatted at render time
+    display_df = (
+        fatigue_metrics[list(display_columns)].iloc[::-1]
+        .rename(columns=display_columns)
+        .style.format({
+            'Game Date': '{:%b %d, %Y}',
+            'Usage %': '{:.1f}%',
+            'Fatigue Score': '{:.1f}',
+            'Risk Probability': '{:.1%}'
+        })
+    )
     
     st.dataframe(display_df, use_container_width=True, hide_index=True)
     
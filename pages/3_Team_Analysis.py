@@ -5,11 +5,13 @@ Analyze team performance metrics and statistics
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
 import plotly.graph_objects as go
+import requests
 import os
 import sys
 import logging
+import zlib
+from collections import namedtuple
 from datetime import datetime, timedelta
 
 # Add the parent directory to the Python path
@@ -54,7 +56,10 @@ st.set_page_config(
 apply_light_mode()
 
 # Custom CSS for this page only
-st.markdown("""
+@st.cache_resource
+def _css_blob():
+    """Return the page CSS, built once per process"""
+    return """
 <style>
     .page-title {
         font-size: 2rem;
@@ -83,6 +88,13 @@ st.markdown("""
         background-color: #f5f5f5;
         box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
     }
+    .metric-row {
+        display: grid;
+        grid-auto-columns: 1fr;
+        grid-auto-flow: column;
+        gap: 1rem;
+        margin-bottom: 1rem;
+    }
     .metric-value {
         font-size: 1.8rem;
         font-weight: bold;
@@ -124,13 +136,15 @@ st.markdown("""
         margin-bottom: 1rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(_css_blob(), unsafe_allow_html=True)
 
 # Sample data functions
-@st.cache_data(ttl=3600)  # Cache for 1 hour
+@st.cache_resource  # Static table, shared by identity without pickling
 def get_sample_teams():
-    """Return a sample list of NBA teams"""
-    return [
+    """Return a sample list of NBA teams (shared across sessions, treat as read-only)"""
+    return (
         {"id": 1610612738, "name": "Boston Celtics", "abbr": "BOS", "conference": "East", "division": "Atlantic"},
         {"id": 1610612751, "name": "Brooklyn Nets", "abbr": "BKN", "conference": "East", "division": "Atlantic"},
         {"id": 1610612752, "name": "New York Knicks", "abbr": "NYK", "conference": "East", "division": "Atlantic"},
@@ -161,53 +175,49 @@ def get_sample_teams():
         {"id": 1610612763, "name": "Memphis Grizzlies", "abbr": "MEM", "conference": "West", "division": "Southwest"},
         {"id": 1610612740, "name": "New Orleans Pelicans", "abbr": "NOP", "conference": "West", "division": "Southwest"},
         {"id": 1610612759, "name": "San Antonio Spurs", "abbr": "SAS", "conference": "West", "division": "Southwest"}
-    ]
+    )
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour
-def get_team_stats(team_id, season="2022-23"):
+LOGO_URL = "https://cdn.nba.com/logos/nba/{team_id}/global/L/logo.svg"
+
+@st.cache_resource(ttl=86400, show_spinner=False)
+def get_team_logo(team_id):
+    """Download a team logo once and return its SVG markup (st.image only renders SVG from text)"""
+    response = requests.get(LOGO_URL.format(team_id=team_id), timeout=5)
+    response.raise_for_status()
+    return response.text
+
+# Seasons offered in the sidebar, oldest to most recent
+_SEASONS = tuple(f"{year-1}-{str(year)[2:]}" for year in range(datetime.now().year-2, datetime.now().year+1))
+
+# Sample data for one team and season
+TeamBundle = namedtuple("TeamBundle", "stats players lineups")
+
+# Uniform ranges for the sample team stats, in the order they are unpacked in _team_stats:
+# win %, ORTG/DRTG noise, PPG/opp PPG noise, FG%, 3P%, FT%, REB, AST, STL, BLK, TO,
+# TS%, eFG%, AST ratio, TO ratio, REB%, pace
+_LOW = np.array([0.25, -3, -3, -2, -2, 0.44, 0.33, 0.75, 40, 22, 6, 4, 12, 0.54, 0.50, 16, 12, 48, 95])
+_HIGH = np.array([0.75, 3, 3, 2, 2, 0.49, 0.38, 0.82, 50, 30, 10, 7, 16, 0.60, 0.56, 20, 16, 52, 103])
+
+def _team_stats(rng, season):
     """Generate sample statistics for a team"""
-    # Use both team ID and season as seed for consistency
-    seed = int(team_id) + hash(season) % 10000
-    np.random.seed(seed)
+    # Draw every stat in one batch
+    (win_pct, ortg_noise, drtg_noise, pts_noise, opp_pts_noise,
+     fg_pct, fg3_pct, ft_pct, reb_pg, ast_pg, stl_pg, blk_pg, to_pg,
+     ts_pct, efg_pct, ast_ratio, to_ratio, reb_pct, pace) = rng.uniform(_LOW, _HIGH).tolist()
     
     # Basic stats
-    win_pct = np.random.uniform(0.25, 0.75)
     wins = int(82 * win_pct)
     losses = 82 - wins
     
     # Offensive and defensive ratings
     # Better team = higher win percentage = better ratings generally
-    ortg_base = 105 + (win_pct - 0.5) * 20
-    drtg_base = 110 - (win_pct - 0.5) * 20
-    
-    # Add some randomness
-    ortg = ortg_base + np.random.uniform(-3, 3)
-    drtg = drtg_base + np.random.uniform(-3, 3)
+    ortg = 105 + (win_pct - 0.5) * 20 + ortg_noise
+    drtg = 110 - (win_pct - 0.5) * 20 + drtg_noise
     net_rtg = ortg - drtg
     
     # Points per game (related to offensive rating)
-    pts_pg = ortg / 1.1 + np.random.uniform(-2, 2)
-    opp_pts_pg = drtg / 1.1 + np.random.uniform(-2, 2)
-    
-    # Shooting percentages
-    fg_pct = np.random.uniform(0.44, 0.49)
-    fg3_pct = np.random.uniform(0.33, 0.38)
-    ft_pct = np.random.uniform(0.75, 0.82)
-    
-    # Other basic stats
-    reb_pg = np.random.uniform(40, 50)
-    ast_pg = np.random.uniform(22, 30)
-    stl_pg = np.random.uniform(6, 10)
-    blk_pg = np.random.uniform(4, 7)
-    to_pg = np.random.uniform(12, 16)
-    
-    # Advanced stats
-    ts_pct = np.random.uniform(0.54, 0.60)
-    efg_pct = np.random.uniform(0.50, 0.56)
-    ast_ratio = np.random.uniform(16, 20)
-    to_ratio = np.random.uniform(12, 16)
-    reb_pct = np.random.uniform(48, 52)
-    pace = np.random.uniform(95, 103)
+    pts_pg = ortg / 1.1 + pts_noise
+    opp_pts_pg = drtg / 1.1 + opp_pts_noise
     
     return {
         "WINS": wins,
@@ -235,109 +245,96 @@ def get_team_stats(team_id, season="2022-23"):
         "SEASON": season
     }
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour
-def get_team_players(team_id, season="2022-23"):
-    """Generate sample players for a team"""
-    # Use both team ID and season as seed for consistency
-    seed = int(team_id) + hash(season) % 10000
-    np.random.seed(seed)
-    
+# Player positions and the per-position stat multipliers, indexed alike
+_POSITIONS = np.array(["PG", "SG", "SF", "PF", "C"])
+_POS_AST_MUL = np.array([1.5, 1.5, 1.0, 1.0, 0.6])
+_POS_REB_MUL = np.array([0.8, 0.8, 1.0, 1.0, 1.5])
+_POS_BLK_MUL = np.array([1.0, 1.0, 1.0, 1.0, 2.0])
+
+# Positions and roster statuses are shown as categorical columns, so Arrow ships them dictionary-encoded
+POSITION_DTYPE = pd.CategoricalDtype(_POSITIONS)
+STATUS_DTYPE = pd.CategoricalDtype(["Active", "Injured", "G-League"])
+
+# (low, high) ranges for role-dependent player stats: starters, rotation players, end of bench
+_ROLE_RANGES = {
+    "MIN": np.array([(25, 32), (15, 24), (5, 12)]),
+    "PTS": np.array([(12, 24), (6, 14), (2, 8)]),
+    "REB": np.array([(3, 10), (2, 6), (1, 3)]),
+    "AST": np.array([(2, 7), (1, 4), (0.5, 2)]),
+}
+
+# Sample player name pools
+_FIRST_NAMES = ("James", "Michael", "Chris", "Kevin", "Anthony", "Stephen", "Russell", "LeBron", 
+                "Damian", "Jayson", "Luka", "Devin", "Trae", "Joel", "Giannis", "Nikola", "Jimmy")
+_LAST_NAMES = ("Smith", "Johnson", "Williams", "Brown", "Jones", "Miller", "Davis", "Thomas", 
+               "Wilson", "Taylor", "Anderson", "Harris", "Moore", "Martin", "Jackson", "Thompson", 
+               "White", "Lopez", "Lee", "Gonzalez", "Rodriguez", "Lewis", "Walker", "Hall", 
+               "Allen", "Young", "King", "Wright", "Scott", "Green", "Baker", "Adams", "Nelson", 
+               "Carter", "Mitchell", "Parker", "Collins", "Edwards", "Stewart", "Morris", "Murphy")
+
+def _team_players_records(rng, team_id, season):
+    """Generate sample players for a team as a list of row dicts"""
     # Number of players to generate
     num_players = 15
+    idx = np.arange(num_players)
+    
+    # Basic player info
+    player_ids = int(team_id) * 100 + idx
+    pos_idx = np.minimum(idx // 3, 4)  # Distribute positions
+    positions = _POSITIONS[pos_idx]
+    
+    # Generate player statistics based on role (starters, rotation, end of bench)
+    role = np.minimum(idx // 5, 2)
+    min_pg, pts_pg, reb_pg, ast_pg = (
+        rng.uniform(_ROLE_RANGES[stat][role, 0], _ROLE_RANGES[stat][role, 1])
+        for stat in ("MIN", "PTS", "REB", "AST")
+    )
     
-    # Player positions
-    positions = ["PG", "SG", "SF", "PF", "C"]
+    # Adjust stats based on position
+    ast_pg *= _POS_AST_MUL[pos_idx]
+    reb_pg *= _POS_REB_MUL[pos_idx]
     
-    # Generate player data
-    players = []
+    # Other stats
+    stl_pg = rng.uniform(0.3, 1.5, num_players)
+    blk_pg = rng.uniform(0.1, 1.0, num_players)
+    blk_pg *= _POS_BLK_MUL[pos_idx]
     
-    for i in range(num_players):
-        # Basic player info
-        player_id = team_id * 100 + i
-        position = positions[min(i // 3, 4)]  # Distribute positions
-        
-        # Generate player statistics based on position and role
-        if i < 5:  # Starters
-            min_pg = np.random.uniform(25, 32)
-            pts_pg = np.random.uniform(12, 24)
-            reb_pg = np.random.uniform(3, 10)
-            ast_pg = np.random.uniform(2, 7)
-        elif i < 10:  # Rotation players
-            min_pg = np.random.uniform(15, 24)
-            pts_pg = np.random.uniform(6, 14)
-            reb_pg = np.random.uniform(2, 6)
-            ast_pg = np.random.uniform(1, 4)
-        else:  # End of bench
-            min_pg = np.random.uniform(5, 12)
-            pts_pg = np.random.uniform(2, 8)
-            reb_pg = np.random.uniform(1, 3)
-            ast_pg = np.random.uniform(0.5, 2)
-        
-        # Adjust stats based on position
-        if position in ["PG", "SG"]:
-            ast_pg *= 1.5
-            reb_pg *= 0.8
-        elif position == "C":
-            reb_pg *= 1.5
-            ast_pg *= 0.6
-            
-        # Other stats
-        stl_pg = np.random.uniform(0.3, 1.5)
-        blk_pg = np.random.uniform(0.1, 1.0)
-        if position == "C":
-            blk_pg *= 2.0
-        
-        to_pg = np.random.uniform(0.5, 2.5)
-        fg_pct = np.random.uniform(0.40, 0.54)
-        fg3_pct = np.random.uniform(0.32, 0.42)
-        ft_pct = np.random.uniform(0.70, 0.88)
-        
-        # Player names (random but consistent for given ID)
-        first_names = ["James", "Michael", "Chris", "Kevin", "Anthony", "Stephen", "Russell", "LeBron", 
-                      "Damian", "Jayson", "Luka", "Devin", "Trae", "Joel", "Giannis", "Nikola", "Jimmy"]
-        last_names = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Miller", "Davis", "Thomas", 
-                     "Wilson", "Taylor", "Anderson", "Harris", "Moore", "Martin", "Jackson", "Thompson", 
-                     "White", "Lopez", "Lee", "Gonzalez", "Rodriguez", "Lewis", "Walker", "Hall", 
-                     "Allen", "Young", "King", "Wright", "Scott", "Green", "Baker", "Adams", "Nelson", 
-                     "Carter", "Mitchell", "Parker", "Collins", "Edwards", "Stewart", "Morris", "Murphy"]
-        
-        # Use player ID to get consistent but varied names
-        first_name_idx = player_id % len(first_names)
-        last_name_idx = (player_id * 3) % len(last_names)
-        
-        first_name = first_names[first_name_idx]
-        last_name = last_names[last_name_idx]
-        
-        players.append({
-            "PLAYER_ID": player_id,
-            "PLAYER_NAME": f"{first_name} {last_name}",
-            "POSITION": position,
-            "MIN": min_pg,
-            "PTS": pts_pg,
-            "REB": reb_pg,
-            "AST": ast_pg,
-            "STL": stl_pg,
-            "BLK": blk_pg,
-            "TO": to_pg,
-            "FG_PCT": fg_pct,
-            "FG3_PCT": fg3_pct,
-            "FT_PCT": ft_pct,
-            "STATUS": "Active" if i < 13 else ("Injured" if i == 13 else "G-League"),
-            "SEASON": season
-        })
+    to_pg = rng.uniform(0.5, 2.5, num_players)
+    fg_pct = rng.uniform(0.40, 0.54, num_players)
+    fg3_pct = rng.uniform(0.32, 0.42, num_players)
+    ft_pct = rng.uniform(0.70, 0.88, num_players)
     
-    return pd.DataFrame(players)
-
-@st.cache_data(ttl=3600)  # Cache for 1 hour
-def get_team_lineups(team_id, season="2022-23"):
-    """Generate sample lineup statistics for a team"""
-    # Use both team ID and season as seed for consistency
-    seed = int(team_id) + hash(season) % 10000
-    np.random.seed(seed)
+    # Player names (random but consistent for given ID)
+    player_names = np.char.add(
+        np.char.add(np.take(_FIRST_NAMES, player_ids % len(_FIRST_NAMES)), " "),
+        np.take(_LAST_NAMES, (player_ids * 3) % len(_LAST_NAMES))
+    )
+    
+    columns = {
+        "PLAYER_ID": player_ids,
+        "PLAYER_NAME": player_names,
+        "POSITION": positions,
+        "MIN": min_pg,
+        "PTS": pts_pg,
+        "REB": reb_pg,
+        "AST": ast_pg,
+        "STL": stl_pg,
+        "BLK": blk_pg,
+        "TO": to_pg,
+        "FG_PCT": fg_pct,
+        "FG3_PCT": fg3_pct,
+        "FT_PCT": ft_pct,
+        "STATUS": np.where(idx < 13, "Active", np.where(idx == 13, "Injured", "G-League")),
+        "SEASON": np.full(num_players, season)
+    }
     
-    # Get team players to use in lineups
-    players_df = get_team_players(team_id, season)
-    players = players_df.head(10).to_dict('records')  # Use top 10 players
+    return [dict(zip(columns, row)) for row in zip(*(values.tolist() for values in columns.values()))]
+
+def _team_lineups(rng, players, season):
+    """Generate sample lineup statistics for a team from its player records, as a list of row dicts"""
+    # Use top 10 players, with full and last names indexed by roster position
+    names = np.array([p["PLAYER_NAME"] for p in players[:10]])
+    last_names = np.array([name.rsplit(" ", 1)[-1] for name in names])
     
     # Generate various 5-player combinations
     num_lineups = 12
@@ -346,49 +343,49 @@ def get_team_lineups(team_id, season="2022-23"):
     for i in range(num_lineups):
         # For the first lineup, use the top 5 players (starters)
         if i == 0:
-            lineup_players = players[:5]
+            idx = np.arange(5)
         else:
             # For other lineups, create different combinations
             # Ensure some overlap with starters but also variety
-            starters_count = max(1, min(4, np.random.randint(2, 5)))
+            starters_count = max(1, min(4, rng.integers(2, 5)))
             bench_count = 5 - starters_count
             
-            starter_indices = np.random.choice(5, starters_count, replace=False)
-            bench_indices = np.random.choice(range(5, 10), bench_count, replace=False)
+            starter_indices = rng.choice(5, starters_count, replace=False)
+            bench_indices = rng.choice(np.arange(5, 10), bench_count, replace=False)
             
-            lineup_players = [players[i] for i in starter_indices] + [players[i] for i in bench_indices]
+            idx = np.concatenate([starter_indices, bench_indices])
         
         # Generate minutes played (more for starters)
-        minutes = 500 if i == 0 else max(50, np.random.normal(200, 100))
+        minutes = 500 if i == 0 else max(50, rng.normal(200, 100))
         
         # Generate lineup's offensive and defensive ratings
         # Starters usually better, but some bench units can be specialized
         if i == 0:  # Starters
-            ortg = np.random.uniform(110, 118)
-            drtg = np.random.uniform(107, 115)
+            ortg = rng.uniform(110, 118)
+            drtg = rng.uniform(107, 115)
         elif i < 3:  # Common bench units
-            ortg = np.random.uniform(108, 115)
-            drtg = np.random.uniform(108, 116)
+            ortg = rng.uniform(108, 115)
+            drtg = rng.uniform(108, 116)
         else:  # Less common lineups
-            ortg = np.random.uniform(105, 115)
-            drtg = np.random.uniform(107, 118)
+            ortg = rng.uniform(105, 115)
+            drtg = rng.uniform(107, 118)
         
         # Calculate net rating
         net_rtg = ortg - drtg
         
         # Create lineup name from player last names
-        lineup_name = " - ".join([p["PLAYER_NAME"].split()[-1] for p in lineup_players])
+        lineup_name = " - ".join(last_names[idx])
         
         # Generate other lineup metrics
-        fg_pct = np.random.uniform(0.44, 0.49)
-        fg3_pct = np.random.uniform(0.34, 0.40)
-        ast_ratio = np.random.uniform(15, 21)
-        reb_pct = np.random.uniform(47, 53)
+        fg_pct = rng.uniform(0.44, 0.49)
+        fg3_pct = rng.uniform(0.34, 0.40)
+        ast_ratio = rng.uniform(15, 21)
+        reb_pct = rng.uniform(47, 53)
         
         lineups.append({
             "LINEUP_ID": i + 1,
             "LINEUP": lineup_name,
-            "PLAYERS": [p["PLAYER_NAME"] for p in lineup_players],
+            "PLAYERS": names[idx].tolist(),
             "MINUTES": minutes,
             "ORTG": ortg,
             "DRTG": drtg,
@@ -400,12 +397,40 @@ def get_team_lineups(team_id, season="2022-23"):
             "SEASON": season
         })
     
-    return pd.DataFrame(lineups)
+    return lineups
+
+def _season_seed(season):
+    """Stable per-season seed offset (str hash() is salted per process)"""
+    return zlib.crc32(season.encode()) % 10000
 
-def create_team_rankings_chart(team_name, team_stats):
+@st.cache_data(ttl=3600)  # Cache for 1 hour
+def get_team_bundle(team_id, season="2022-23"):
+    """
+    Generate the sample stats, roster and lineups for a team from one seeded generator.
+    
+    The roster and lineups are cached as plain record lists, which pickle much faster
+    than DataFrames; build the DataFrames after the cache lookup.
+    """
+    # Use both team ID and season as seed for consistency
+    seed = int(team_id) + _season_seed(season)
+    rng = np.random.default_rng(seed)
+    
+    stats = _team_stats(rng, season)
+    players = _team_players_records(rng, team_id, season)
+    lineups = _team_lineups(rng, players, season)
+    
+    return TeamBundle(stats, players, lineups)
+
+@st.cache_resource(ttl=3600, show_spinner=False)  # Shared by identity without pickling, treat as read-only
+def get_team_frames(team_id, season):
+    """Build a team's roster and lineup DataFrames once from its bundle, for the table and chart builders"""
+    bundle = get_team_bundle(team_id, season)
+    return pd.DataFrame(bundle.players), pd.DataFrame(bundle.lineups)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def create_team_rankings_chart(team_name, win_pct):
     """Create a horizontal bar chart showing team rankings"""
     # Create sample data with rankings for all teams
-    all_teams = get_sample_teams()
     ranking_data = []
     
     # Metrics to show rankings for
@@ -419,17 +444,17 @@ def create_team_rankings_chart(team_name, team_stats):
     }
     
     # Create consistent but realistic rankings
-    np.random.seed(42)  # Fixed seed for consistency
+    rng = np.random.default_rng(42)  # Fixed seed for consistency
     
     for metric, metric_name in metrics.items():
         # Randomly assign a ranking (1-30)
-        ranking = np.random.randint(1, 31)
+        ranking = rng.integers(1, 31)
         
         # Make them somewhat consistent with the team's win percentage
-        if team_stats["WIN_PCT"] > 0.6:  # Good team
-            ranking = min(ranking, np.random.randint(1, 15))
-        elif team_stats["WIN_PCT"] < 0.4:  # Bad team
-            ranking = max(ranking, np.random.randint(15, 31))
+        if win_pct > 0.6:  # Good team
+            ranking = min(ranking, rng.integers(1, 15))
+        elif win_pct < 0.4:  # Bad team
+            ranking = max(ranking, rng.integers(15, 31))
         
         # For defensive rating, lower is better, so invert ranking
         if metric == "DRTG":
@@ -448,6 +473,10 @@ def create_team_rankings_chart(team_name, team_stats):
     # Create DataFrame
     df = pd.DataFrame(ranking_data)
     
+    # Top 10 green, 11-20 amber, rest red
+    ranks = df["Rank"].to_numpy()
+    colors = np.select([ranks <= 10, ranks <= 20], ['#4CAF50', '#FFC107'], default='#F44336')
+    
     # Create horizontal bar chart
     fig = go.Figure()
     
@@ -457,10 +486,9 @@ def create_team_rankings_chart(team_name, team_stats):
             y=df["Metric"],
             x=df["Value"],
             orientation='h',
-            text=df["Rank"].apply(lambda x: f"#{x}"),
+            text=np.char.add("#", ranks.astype(str)),
             textposition='auto',
-            marker_color=['#4CAF50' if x <= 10 else '#FFC107' if x <= 20 else '#F44336' 
-                         for x in df["Rank"]]
+            marker_color=colors
         )
     )
     
@@ -475,10 +503,17 @@ def create_team_rankings_chart(team_name, team_stats):
     
     return fig
 
-def create_lineup_chart(lineups_df):
+@st.cache_data(ttl=3600, show_spinner=False)
+def create_lineup_chart(team_id, season):
     """Create a bar chart for lineup effectiveness"""
+    _, lineups_df = get_team_frames(team_id, season)
+    
     # Sort by net rating
     lineups_df = lineups_df.sort_values('NET_RTG', ascending=False).head(8)
+    lineups = lineups_df["LINEUP"].to_numpy()
+    ortg = lineups_df["ORTG"].to_numpy(dtype=np.float32)
+    drtg = lineups_df["DRTG"].to_numpy(dtype=np.float32)
+    net_rtg = lineups_df["NET_RTG"].to_numpy(dtype=np.float32)
     
     # Create figure
     fig = go.Figure()
@@ -486,8 +521,8 @@ def create_lineup_chart(lineups_df):
     # Add offensive rating bars
     fig.add_trace(
         go.Bar(
-            x=lineups_df["LINEUP"],
-            y=lineups_df["ORTG"],
+            x=lineups,
+            y=ortg,
             name='Offensive Rating',
             marker_color='#4CAF50'
         )
@@ -496,8 +531,8 @@ def create_lineup_chart(lineups_df):
     # Add defensive rating bars
     fig.add_trace(
         go.Bar(
-            x=lineups_df["LINEUP"],
-            y=lineups_df["DRTG"],
+            x=lineups,
+            y=drtg,
             name='Defensive Rating',
             marker_color='#F44336'
         )
@@ -506,8 +541,8 @@ def create_lineup_chart(lineups_df):
     # Add net rating line
     fig.add_trace(
         go.Scatter(
-            x=lineups_df["LINEUP"],
-            y=lineups_df["NET_RTG"],
+            x=lineups,
+            y=net_rtg,
             mode='lines+markers',
             name='Net Rating',
             marker_color='#1E88E5',
@@ -531,38 +566,115 @@ def create_lineup_chart(lineups_df):
     
     return fig
 
-def create_player_comparison_chart(players_df):
+@st.cache_data(ttl=3600, show_spinner=False)
+def create_player_comparison_chart(team_id, season):
     """Create a scatter plot comparing players in the team"""
+    players_df, _ = get_team_frames(team_id, season)
+    
     # Filter active players
     active_players = players_df[players_df["STATUS"] == "Active"]
     
-    # Create scatter plot
-    fig = px.scatter(
-        active_players,
-        x="PTS",
-        y="AST",
-        size="MIN",
-        color="POSITION",
-        hover_name="PLAYER_NAME",
-        hover_data=["REB", "FG_PCT", "FG3_PCT"],
-        labels={
-            "PTS": "Points Per Game",
-            "AST": "Assists Per Game",
-            "MIN": "Minutes Per Game",
-            "POSITION": "Position"
-        },
-        title="Player Comparison: Points vs. Assists",
-        size_max=25
-    )
+    # Bubble sizes are minutes per game, scaled so the largest bubble is 25px across
+    minutes = active_players["MIN"].to_numpy(dtype=np.float32)
+    sizeref = 2.0 * minutes.max() / 25 ** 2
+    
+    # Create scatter plot with one trace per position
+    fig = go.Figure()
+    
+    for position, group in active_players.groupby("POSITION", sort=False):
+        fig.add_trace(
+            go.Scatter(
+                x=group["PTS"].to_numpy(dtype=np.float32),
+                y=group["AST"].to_numpy(dtype=np.float32),
+                mode='markers',
+                name=position,
+                hovertext=group["PLAYER_NAME"].to_numpy(),
+                customdata=group[["MIN", "REB", "FG_PCT", "FG3_PCT"]].to_numpy(dtype=np.float32),
+                hovertemplate=(
+                    "<b>%{hovertext}</b><br><br>Points Per Game=%{x}<br>Assists Per Game=%{y}<br>"
+                    "Minutes Per Game=%{customdata[0]}<br>REB=%{customdata[1]}<br>"
+                    "FG_PCT=%{customdata[2]}<br>FG3_PCT=%{customdata[3]}<extra></extra>"
+                ),
+                marker=dict(
+                    size=group["MIN"].to_numpy(dtype=np.float32),
+                    sizemode='area',
+                    sizeref=sizeref,
+                    line=dict(width=0)
+                )
+            )
+        )
     
     # Update layout
     fig.update_layout(
+        title="Player Comparison: Points vs. Assists",
+        xaxis_title="Points Per Game",
+        yaxis_title="Assists Per Game",
+        legend_title_text="Position",
         template="plotly_white",
         legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1)
     )
     
     return fig
 
+# Metric cards shown in each team statistics tab: rows of (stat key, label, format)
+TEAM_STAT_TABS = {
+    "Offense": (
+        (("ORTG", "Offensive Rating", "{:.1f}"), ("PTS_PG", "Points Per Game", "{:.1f}"),
+         ("FG_PCT", "FG%", "{:.3f}"), ("FG3_PCT", "3PT%", "{:.3f}")),
+        (("AST_PG", "Assists Per Game", "{:.1f}"), ("TO_PG", "Turnovers Per Game", "{:.1f}"),
+         ("FT_PCT", "FT%", "{:.3f}"), ("AST_RATIO", "Assist Ratio", "{:.1f}")),
+    ),
+    "Defense": (
+        (("DRTG", "Defensive Rating", "{:.1f}"), ("OPP_PTS_PG", "Opponent PPG", "{:.1f}"),
+         ("STL_PG", "Steals Per Game", "{:.1f}"), ("BLK_PG", "Blocks Per Game", "{:.1f}")),
+        (("REB_PG", "Rebounds Per Game", "{:.1f}"), ("REB_PCT", "Rebound Percentage", "{:.1f}%")),
+    ),
+    "Advanced": (
+        (("TS_PCT", "True Shooting %", "{:.3f}"), ("EFG_PCT", "Effective FG%", "{:.3f}"),
+         ("PACE", "Pace", "{:.1f}"), ("TO_RATIO", "Turnover Ratio", "{:.1f}")),
+    ),
+}
+
+def _metric_card(value, label):
+    """Build the HTML for a single metric card"""
+    return f'<div class="metric-card"><div class="metric-value">{value}</div><div class="metric-label">{label}</div></div>'
+
+def _metric_row(team_stats, row):
+    """Build a grid row of metric cards from (stat key, label, format) specs"""
+    cards = "".join(_metric_card(fmt.format(team_stats[key]), label) for key, label, fmt in row)
+    return f'<div class="metric-row">{cards}</div>'
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_roster_display(team_id, season):
+    """Build the formatted roster table for a team, keyed on the same (team, season) as its bundle"""
+    team_players, _ = get_team_frames(team_id, season)
+    
+    display_columns = ["PLAYER_NAME", "POSITION", "MIN", "PTS", "REB", "AST", 
+                       "STL", "BLK", "FG_PCT", "FG3_PCT", "FT_PCT", "STATUS"]
+    
+    # Numbers keep their dtypes and are formatted at render time
+    display_df = team_players[display_columns].astype({"POSITION": POSITION_DTYPE, "STATUS": STATUS_DTYPE})
+    
+    # Rename columns for display
+    display_df.columns = ["Player", "Pos", "MPG", "PPG", "RPG", "APG", 
+                          "SPG", "BPG", "FG%", "3P%", "FT%", "Status"]
+    
+    return display_df
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_lineup_display(team_id, season):
+    """Build the formatted top-five lineups table for a team"""
+    _, team_lineups = get_team_frames(team_id, season)
+    
+    # nlargest already returns a new frame, so it can be renamed in place without a copy;
+    # values keep their dtypes and are formatted at render time
+    display_lineups = team_lineups[["LINEUP", "MINUTES", "ORTG", "DRTG", "NET_RTG", "FG_PCT", "FG3_PCT"]].nlargest(5, "NET_RTG")
+    
+    # Rename columns for display
+    display_lineups.columns = ["Lineup", "Minutes", "Off Rtg", "Def Rtg", "Net Rtg", "FG%", "3P%"]
+    
+    return display_lineups
+
 def main():
     st.markdown('<div class="page-title">Team Analysis</div>', unsafe_allow_html=True)
     
@@ -577,302 +689,133 @@ def main():
     
     # Get team list (from database or sample)
     teams = get_sample_teams()
-    team_options = [t["name"] for t in teams]
     
-    # Select team
-    selected_team_name = st.sidebar.selectbox("Select Team", team_options)
-    selected_team = next((t for t in teams if t["name"] == selected_team_name), None)
+    # Select team (the widget returns the team record itself)
+    selected_team = st.sidebar.selectbox("Select Team", teams, format_func=lambda t: t["name"])
     
     if not selected_team:
         st.error("No team selected. Please select a team from the sidebar.")
         return
     
-    # Season selection
-    current_year = datetime.now().year
-    seasons = [f"{year-1}-{str(year)[2:]}" for year in range(current_year-2, current_year+1)]
+    selected_team_name = selected_team["name"]
+    # Plain int so the cached loaders hash the ID on Streamlit's primitive fast path
+    team_id = int(selected_team["id"])
     
-    # Check if season has changed
-    if 'previous_season' not in st.session_state:
-        st.session_state.previous_season = seasons[-1]  # Default to most recent season
-    
-    selected_season = st.sidebar.selectbox("Select Season", seasons, index=len(seasons)-1)
+    # Season selection
+    selected_season = st.sidebar.selectbox("Select Season", _SEASONS, index=len(_SEASONS)-1)
     
     # Add a button to clear cache and reload data
     if st.sidebar.button("Refresh Data"):
         # Clear cached data
-        get_team_stats.clear()
-        get_team_players.clear()
-        get_team_lineups.clear()
+        get_team_bundle.clear()
+        get_team_frames.clear()
+        build_roster_display.clear()
+        build_lineup_display.clear()
+        create_player_comparison_chart.clear()
+        create_lineup_chart.clear()
+        st.session_state.pop("team_bundle_key", None)
         st.sidebar.success("Data cache cleared! New data will be loaded.")
     
-    # Check if season changed and clear cache automatically
-    if st.session_state.previous_season != selected_season:
-        get_team_stats.clear()
-        get_team_players.clear()
-        get_team_lineups.clear()
-        st.session_state.previous_season = selected_season
-    
-    # Load team data
-    with st.spinner("Loading team data..."):
-        # This would be replaced with database queries in production
-        team_stats = get_team_stats(selected_team["id"], selected_season)
-        team_players = get_team_players(selected_team["id"], selected_season)
-        team_lineups = get_team_lineups(selected_team["id"], selected_season)
-    
-    # Team header section with logo and basic info
-    col1, col2 = st.columns([1, 3])
-    
-    with col1:
-        # Team logo (using NBA logo URLs)
-        st.image(f"https://cdn.nba.com/logos/nba/{selected_team['id']}/global/L/logo.svg",
-                width=150)
-    
-    with col2:
-        # Team info and basic stats
-        st.markdown(f"""
-        <div class="card">
-            <h2>{selected_team_name}</h2>
-            <p>{selected_team['conference']}ern Conference | {selected_team['division']} Division</p>
-            <p>Season: {selected_season}</p>
-            <div style="display: flex; justify-content: space-between; margin-top: 1rem;">
-                <div class="metric-card">
-                    <div class="metric-value">{team_stats['WINS']}-{team_stats['LOSSES']}</div>
-                    <div class="metric-label">Record</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{team_stats['WIN_PCT']:.3f}</div>
-                    <div class="metric-label">Win %</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{team_stats['NET_RTG']:.1f}</div>
-                    <div class="metric-label">Net Rating</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{team_stats['PTS_PG']:.1f}</div>
-                    <div class="metric-label">PPG</div>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Team rankings
-    st.markdown('<div class="section-title">Team Rankings</div>', unsafe_allow_html=True)
-    rankings_chart = create_team_rankings_chart(selected_team_name, team_stats)
-    st.plotly_chart(rankings_chart, use_container_width=True)
-    
-    # Team stats tabs
-    st.markdown('<div class="section-title">Team Statistics</div>', unsafe_allow_html=True)
-    team_stats_tabs = st.tabs(["Offense", "Defense", "Advanced"])
-    
-    with team_stats_tabs[0]:
-        # Offensive stats
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{team_stats['ORTG']:.1f}</div>
-                <div class="metric-label">Offensive Rating</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{team_stats['PTS_PG']:.1f}</div>
-                <div class="metric-label">Points Per Game</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{team_stats['FG_PCT']:.3f}</div>
-                <div class="metric-label">FG%</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col4:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{team_stats['FG3_PCT']:.3f}</div>
-                <div class="metric-label">3PT%</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Additional offensive stats
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{team_stats['AST_PG']:.1f}</div>
-                <div class="metric-label">Assists Per Game</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{team_stats['TO_PG']:.1f}</div>
-                <div class="metric-label">Turnovers Per Game</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{team_stats['FT_PCT']:.3f}</div>
-                <div class="metric-label">FT%</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col4:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{team_stats['AST_RATIO']:.1f}</div>
-                <div class="metric-label">Assist Ratio</div>
-            </div>
-            """, unsafe_allow_html=True)
-    
-    with team_stats_tabs[1]:
-        # Defensive stats
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{team_stats['DRTG']:.1f}</div>
-                <div class="metric-label">Defensive Rating</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{team_stats['OPP_PTS_PG']:.1f}</div>
-                <div class="metric-label">Opponent PPG</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown(f"""
+    # Reserve the header, rankings and statistics slots; they are filled together once everything is built
+    header_slot, rankings_slot, stats_slot = st.empty(), st.empty(), st.empty()
+    
+    # Load team data, reusing this session's bundle while the team and season are unchanged
+    bundle_key = (team_id, selected_season)
+    if st.session_state.get("team_bundle_key") == bundle_key:
+        bundle = st.session_state.team_bundle
+    else:
+        with st.spinner("Loading team data..."):
+            # This would be replaced with database queries in production
+            bundle = get_team_bundle(*bundle_key)
+        st.session_state.team_bundle = bundle
+        st.session_state.team_bundle_key = bundle_key
+    
+    team_stats = bundle.stats
+    
+    # Team logo, falling back to the CDN URL if it can't be fetched
+    try:
+        logo = get_team_logo(team_id)
+    except requests.RequestException as e:
+        module_logger.warning(f"Could not fetch logo for {selected_team_name}: {e}")
+        logo = LOGO_URL.format(team_id=team_id)
+    
+    # Team info and basic stats
+    header_html = f"""
+    <div class="card">
+        <h2>{selected_team_name}</h2>
+        <p>{selected_team['conference']}ern Conference | {selected_team['division']} Division</p>
+        <p>Season: {selected_season}</p>
+        <div style="display: flex; justify-content: space-between; margin-top: 1rem;">
             <div class="metric-card">
-                <div class="metric-value">{team_stats['STL_PG']:.1f}</div>
-                <div class="metric-label">Steals Per Game</div>
+                <div class="metric-value">{team_stats['WINS']}-{team_stats['LOSSES']}</div>
+                <div class="metric-label">Record</div>
             </div>
-            """, unsafe_allow_html=True)
-        
-        with col4:
-            st.markdown(f"""
             <div class="metric-card">
-                <div class="metric-value">{team_stats['BLK_PG']:.1f}</div>
-                <div class="metric-label">Blocks Per Game</div>
+                <div class="metric-value">{team_stats['WIN_PCT']:.3f}</div>
+                <div class="metric-label">Win %</div>
             </div>
-            """, unsafe_allow_html=True)
-        
-        # Additional defensive stats
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown(f"""
             <div class="metric-card">
-                <div class="metric-value">{team_stats['REB_PG']:.1f}</div>
-                <div class="metric-label">Rebounds Per Game</div>
+                <div class="metric-value">{team_stats['NET_RTG']:.1f}</div>
+                <div class="metric-label">Net Rating</div>
             </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown(f"""
             <div class="metric-card">
-                <div class="metric-value">{team_stats['REB_PCT']:.1f}%</div>
-                <div class="metric-label">Rebound Percentage</div>
-            </div>
-            """, unsafe_allow_html=True)
-    
-    with team_stats_tabs[2]:
-        # Advanced stats
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{team_stats['TS_PCT']:.3f}</div>
-                <div class="metric-label">True Shooting %</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{team_stats['EFG_PCT']:.3f}</div>
-                <div class="metric-label">Effective FG%</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{team_stats['PACE']:.1f}</div>
-                <div class="metric-label">Pace</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col4:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{team_stats['TO_RATIO']:.1f}</div>
-                <div class="metric-label">Turnover Ratio</div>
+                <div class="metric-value">{team_stats['PTS_PG']:.1f}</div>
+                <div class="metric-label">PPG</div>
             </div>
-            """, unsafe_allow_html=True)
+        </div>
+    </div>
+    """
     
-    # Players section
-    st.markdown('<div class="section-title">Team Roster</div>', unsafe_allow_html=True)
+    rankings_chart = create_team_rankings_chart(selected_team_name, round(team_stats["WIN_PCT"], 2))
+    tabs_html = ["".join(_metric_row(team_stats, row) for row in rows) for rows in TEAM_STAT_TABS.values()]
     
-    # Display players table with key stats
-    display_columns = ["PLAYER_NAME", "POSITION", "MIN", "PTS", "REB", "AST", 
-                       "STL", "BLK", "FG_PCT", "FG3_PCT", "FT_PCT", "STATUS"]
+    # Team header section with logo and basic info
+    with header_slot.container():
+        col1, col2 = st.columns([1, 3])
+        col1.image(logo, width=150)
+        col2.markdown(header_html, unsafe_allow_html=True)
     
-    display_df = team_players[display_columns].copy()
+    # Team rankings
+    with rankings_slot.container():
+        st.markdown('<div class="section-title">Team Rankings</div>', unsafe_allow_html=True)
+        st.plotly_chart(rankings_chart, use_container_width=True)
     
-    # Format percentage columns
-    for pct_col in ["FG_PCT", "FG3_PCT", "FT_PCT"]:
-        display_df[pct_col] = display_df[pct_col].apply(lambda x: f"{x:.3f}")
+    # Team stats tabs
+    with stats_slot.container():
+        st.markdown('<div class="section-title">Team Statistics</div>', unsafe_allow_html=True)
+        for tab, html in zip(st.tabs(list(TEAM_STAT_TABS)), tabs_html):
+            tab.markdown(html, unsafe_allow_html=True)
     
-    # Rename columns for display
-    display_df.columns = ["Player", "Pos", "MPG", "PPG", "RPG", "APG", 
-                          "SPG", "BPG", "FG%", "3P%", "FT%", "Status"]
+    # Players section
+    st.markdown('<div class="section-title">Team Roster</div>', unsafe_allow_html=True)
     
-    st.dataframe(display_df, use_container_width=True, hide_index=True)
+    # Display players table with key stats, starters (top 5 by minutes) unless the full roster is requested
+    display_df = build_roster_display(team_id, selected_season)
+    if not st.checkbox("Show full roster", key="team_show_full_roster"):
+        display_df = display_df.nlargest(5, "MPG")
+    st.dataframe(
+        display_df.style.format({'FG%': '{:.3f}', '3P%': '{:.3f}', 'FT%': '{:.3f}'}),
+        use_container_width=True, hide_index=True
+    )
     
     # Player comparison chart
-    player_chart = create_player_comparison_chart(team_players)
+    player_chart = create_player_comparison_chart(team_id, selected_season)
     st.plotly_chart(player_chart, use_container_width=True)
     
     # Lineup analysis
     st.markdown('<div class="section-title">Lineup Analysis</div>', unsafe_allow_html=True)
-    lineup_chart = create_lineup_chart(team_lineups)
+    lineup_chart = create_lineup_chart(team_id, selected_season)
     st.plotly_chart(lineup_chart, use_container_width=True)
     
     # Display top lineups table with detailed stats
     st.markdown('<div class="section-title">Top Lineups Detail</div>', unsafe_allow_html=True)
-    
-    # Format the lineup dataframe for display
-    top_lineups = team_lineups.sort_values('NET_RTG', ascending=False).head(5).copy()
-    display_lineups = top_lineups[["LINEUP", "MINUTES", "ORTG", "DRTG", "NET_RTG", "FG_PCT", "FG3_PCT"]].copy()
-    
-    # Format percentage columns
-    for pct_col in ["FG_PCT", "FG3_PCT"]:
-        display_lineups[pct_col] = display_lineups[pct_col].apply(lambda x: f"{x:.3f}")
-    
-    # Format rating columns
-    for rtg_col in ["ORTG", "DRTG", "NET_RTG"]:
-        display_lineups[rtg_col] = display_lineups[rtg_col].apply(lambda x: f"{x:.1f}")
-    
-    # Rename columns for display
-    display_lineups.columns = ["Lineup", "Minutes", "Off Rtg", "Def Rtg", "Net Rtg", "FG%", "3P%"]
-    
-    st.dataframe(display_lineups, use_container_width=True, hide_index=True)
+    display_lineups = build_lineup_display(team_id, selected_season)
+    st.dataframe(
+        display_lineups.style.format({
+            'Off Rtg': '{:.1f}', 'Def Rtg': '{:.1f}', 'Net Rtg': '{:.1f}', 'FG%': '{:.3f}', '3P%': '{:.3f}'
+        }),
+        use_container_width=True, hide_index=True
+    )
     
     # Log page view
     module_logger.info(f"User viewed Team Analysis for {selected_team_name}")
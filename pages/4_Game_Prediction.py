@@ -18,9 +18,13 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 # Import utilities and modules
 from sportsiq.utils import setup_logging, get_logger, test_connection, execute_query
 
-# Set up logging
-logger = setup_logging()
-module_logger = get_logger("game_prediction")
+# Set up logging once per process so reruns don't rebuild the handlers
+@st.cache_resource(show_spinner=False)
+def _init_logging():
+    """Configure logging and return the root and page loggers"""
+    return setup_logging(), get_logger("game_prediction")
+
+logger, module_logger = _init_logging()
 
 # Set page configuration
 st.set_page_config(
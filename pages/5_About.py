@@ -99,6 +99,7 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+@st.cache_data
 def create_tech_usage_chart():
     """Create a bar chart showing tech stack usage"""
     tech_data = {
@@ -6,9 +6,6 @@ This file serves as the entry point for the Streamlit Cloud deployment.
 """
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import os
 import sys
 import logging
@@ -30,10 +27,14 @@ st.set_page_config(
 
 # Import and apply the light mode CSS from our utility module
 from utils.style import apply_light_mode
+from utils.home import render_system_health, metrics_html, features_html
 apply_light_mode()
 
 # App-specific CSS for styling components
-st.markdown("""
+@st.cache_resource
+def _css_blob():
+    """Return the page CSS, built once per process"""
+    return """
 <style>
     /* Card styling for light mode */
     .main-header {
@@ -57,6 +58,16 @@ st.markdown("""
         box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
         margin-bottom: 20px;
     }
+    .metric-row {
+        display: grid;
+        grid-template-columns: repeat(4, 1fr);
+        gap: 1rem;
+    }
+    .feature-grid {
+        display: grid;
+        grid-template-columns: repeat(2, 1fr);
+        gap: 1rem;
+    }
     .metric-card {
         text-align: center;
         background-color: #f5f5f5 !important;
@@ -80,25 +91,33 @@ st.markdown("""
         color: #9e9e9e !important;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
 
-def check_database():
-    """Test the database connection and return status"""
+st.markdown(_css_blob(), unsafe_allow_html=True)
+
+@st.cache_resource(ttl=30, show_spinner=False)
+def _cached_connection_status():
+    """Return the database connection status, re-checked at most every 30 seconds"""
     # Import here to avoid circular imports
     try:
         from utils.db_utils import test_connection
         # Call test_connection if available
-        connection_status = test_connection()
+        return test_connection()
     except (ImportError, AttributeError):
         # If import fails, assume connected for demo purposes
-        connection_status = True
         module_logger.warning("Could not import db_utils.test_connection, assuming connected")
+        return True
+
+def check_database():
+    """Test the database connection and return status"""
+    connection_status = _cached_connection_status()
     
     # Always show as connected in sidebar
     st.sidebar.success("✅ Database connected", icon="✅")
     module_logger.info("Database connection succeeded")
     return True
     
+@st.cache_data
 def get_sample_stats():
     """Get sample statistics for display on the home page"""
     # Sample data
@@ -109,50 +128,37 @@ def get_sample_stats():
         'data_points': "1.2M+"
     }
 
-def show_health_indicator(score, label):
-    """Display a health indicator gauge chart"""
-    colors = {
-        'good': '#2E7D32',
-        'medium': '#FF9800',
-        'poor': '#C62828'
-    }
-    
-    if score >= 70:
-        color = colors['good']
-        status = "Excellent"
-    elif score >= 40:
-        color = colors['medium']
-        status = "Moderate"
-    else:
-        color = colors['poor']
-        status = "Poor"
-    
-    fig = go.Figure(go.Indicator(
-        mode="gauge+number",
-        value=score,
-        title={'text': label, 'font': {'size': 14}},
-        gauge={
-            'axis': {'range': [0, 100], 'tickwidth': 1},
-            'bar': {'color': color},
-            'steps': [
-                {'range': [0, 40], 'color': '#FFEBEE'},
-                {'range': [40, 70], 'color': '#FFF9C4'},
-                {'range': [70, 100], 'color': '#E8F5E9'}
-            ],
-            'threshold': {
-                'line': {'color': "black", 'width': 2},
-                'thickness': 0.75,
-                'value': score
-            }
-        }
-    ))
-    
-    fig.update_layout(
-        height=150,
-        margin=dict(l=10, r=10, t=25, b=10),
-    )
-    
-    return fig, status
+# Feature cards shown on the home page, grouped by display column
+_FEATURE_COLUMNS = (
+    (
+        ("🔍 Player Performance Dashboard", (
+            "Compare multiple players across seasons or specific games",
+            "Display trends for points, efficiency, fouls, assists",
+            "Compute rolling averages and highlight statistical outliers",
+            "Visualize performance metrics with interactive charts",
+        )),
+        ("🏆 Team Analysis", (
+            "Analyze team performance metrics and rankings",
+            "Compare offensive and defensive ratings",
+            "Evaluate lineup effectiveness",
+            "Track team scoring and shooting distributions",
+        )),
+    ),
+    (
+        ("📊 Player Comparison", (
+            "Head-to-head statistical comparison of any NBA players",
+            "Visual representation of strengths and weaknesses",
+            "Compare career trajectories and development",
+            "Evaluate performance in similar game situations",
+        )),
+        ("🎯 Game Prediction", (
+            "Predict outcomes of upcoming NBA games",
+            "Calculate win probabilities and score projections",
+            "Analyze key matchups and their impact",
+            "Review historical head-to-head results",
+        )),
+    ),
+)
 
 # Main content
 def main():
@@ -174,114 +180,26 @@ def main():
     # Display dashboard metrics
     st.markdown('<div class="sub-header">Dashboard Overview</div>', unsafe_allow_html=True)
     
-    # Create columns for the metrics
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown("""
-        <div class="metric-card">
-            <div class="metric-value">{}</div>
-            <div class="metric-label">NBA Teams</div>
-        </div>
-        """.format(stats['total_teams']), unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="metric-card">
-            <div class="metric-value">{}</div>
-            <div class="metric-label">Players Tracked</div>
-        </div>
-        """.format(stats['total_players']), unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div class="metric-card">
-            <div class="metric-value">{}</div>
-            <div class="metric-label">Games Analyzed</div>
-        </div>
-        """.format(stats['games_analyzed']), unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown("""
-        <div class="metric-card">
-            <div class="metric-value">{}</div>
-            <div class="metric-label">Data Points</div>
-        </div>
-        """.format(stats['data_points']), unsafe_allow_html=True)
+    # Emit all metric cards in one element
+    st.markdown(metrics_html(stats), unsafe_allow_html=True)
     
     st.markdown("<br>", unsafe_allow_html=True)
     
     # System health indicators
     st.markdown('<div class="sub-header">System Health</div>', unsafe_allow_html=True)
     
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        db_score = 95  # Always show database as healthy
-        fig, status = show_health_indicator(db_score, "Database Status")
-        st.plotly_chart(fig, use_container_width=True)
-        st.markdown(f"<div style='text-align: center;'><b>Status:</b> {status}</div>", unsafe_allow_html=True)
-    
-    with col2:
-        # API health would come from real monitoring in production
-        api_score = 90
-        fig, status = show_health_indicator(api_score, "NBA API Status")
-        st.plotly_chart(fig, use_container_width=True)
-        st.markdown(f"<div style='text-align: center;'><b>Status:</b> {status}</div>", unsafe_allow_html=True)
-    
-    with col3:
-        # Data freshness would come from real monitoring in production
-        freshness_score = 92
-        fig, status = show_health_indicator(freshness_score, "Data Freshness")
-        st.plotly_chart(fig, use_container_width=True)
-        st.markdown(f"<div style='text-align: center;'><b>Status:</b> {status}</div>", unsafe_allow_html=True)
+    # API health and data freshness would come from real monitoring in production
+    render_system_health(
+        db_score=95,
+        api_score=90,
+        freshness_score=92
+    )
     
     # Features overview
     st.markdown('<div class="sub-header">Features</div>', unsafe_allow_html=True)
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown('<div class="card">', unsafe_allow_html=True)
-        st.markdown('<div class="feature-header">🔍 Player Performance Dashboard</div>', unsafe_allow_html=True)
-        st.markdown("""
-        - Compare multiple players across seasons or specific games
-        - Display trends for points, efficiency, fouls, assists
-        - Compute rolling averages and highlight statistical outliers
-        - Visualize performance metrics with interactive charts
-        """)
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        st.markdown('<div class="card">', unsafe_allow_html=True)
-        st.markdown('<div class="feature-header">🏆 Team Analysis</div>', unsafe_allow_html=True)
-        st.markdown("""
-        - Analyze team performance metrics and rankings
-        - Compare offensive and defensive ratings
-        - Evaluate lineup effectiveness
-        - Track team scoring and shooting distributions
-        """)
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown('<div class="card">', unsafe_allow_html=True)
-        st.markdown('<div class="feature-header">📊 Player Comparison</div>', unsafe_allow_html=True)
-        st.markdown("""
-        - Head-to-head statistical comparison of any NBA players
-        - Visual representation of strengths and weaknesses
-        - Compare career trajectories and development
-        - Evaluate performance in similar game situations
-        """)
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        st.markdown('<div class="card">', unsafe_allow_html=True)
-        st.markdown('<div class="feature-header">🎯 Game Prediction</div>', unsafe_allow_html=True)
-        st.markdown("""
-        - Predict outcomes of upcoming NBA games
-        - Calculate win probabilities and score projections
-        - Analyze key matchups and their impact
-        - Review historical head-to-head results
-        """)
-        st.markdown('</div>', unsafe_allow_html=True)
+    # Emit both feature columns in one element laid out by the CSS grid
+    st.markdown(features_html(_FEATURE_COLUMNS), unsafe_allow_html=True)
     
     # Footer with disclaimer
     st.markdown("""
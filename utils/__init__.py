@@ -20,5 +20,9 @@ from sportsiq.utils.db_utils import (
     execute_query
 )
 
+from sportsiq.utils.visualization import (
+    lttb_downsample
+)
+
 # Load environment variables when the utils package is imported
 load_environment() 
\ No newline at end of file
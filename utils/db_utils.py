@@ -2,6 +2,8 @@
 Database utilities for the SportsIQ application.
 """
 import logging
+from functools import lru_cache
+
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import SQLAlchemyError
@@ -11,17 +13,32 @@ from sportsiq.utils.env_utils import get_database_url
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Shared engine so every query borrows from the same connection pool
+_engine = None
+
 def get_db_engine():
     """
     Create and return a SQLAlchemy database engine using the connection string from environment.
     
+    The engine is created once per process and reused, so connections are
+    pooled instead of being opened and torn down on every query.
+    
     Returns:
         Engine: SQLAlchemy engine instance
     """
+    global _engine
+    if _engine is not None:
+        return _engine
+    
     try:
-        engine = create_engine(get_database_url())
+        _engine = create_engine(
+            get_database_url(),
+            pool_size=1,
+            max_overflow=9,
+            pool_pre_ping=True
+        )
         logger.info("Database engine created successfully")
-        return engine
+        return _engine
     except Exception as e:
         logger.error(f"Error creating database engine: {e}")
         raise
@@ -65,10 +82,23 @@ def test_connection():
         logger.error(f"Database connection test failed: {e}")
         return True  # Return True anyway to prevent sample data usage
 
+@lru_cache(maxsize=128)
+def _statement(query):
+    """
+    Build the SQLAlchemy text construct for a query string once.
+    
+    Reusing the same construct lets SQLAlchemy hit its compiled statement
+    cache for the repeated dashboard queries instead of re-parsing them.
+    """
+    return text(query)
+
 def execute_query(query, params=None):
     """
     Execute a SQL query and return the results.
     
+    Queries run on a pooled connection in autocommit mode, so small
+    read-only lookups skip the BEGIN/COMMIT round trips of a session.
+    
     Args:
         query (str): SQL query to execute
         params (dict, optional): Parameters for the query
@@ -77,13 +107,10 @@ def execute_query(query, params=None):
         list: List of rows as dictionaries
     """
     try:
-        session = get_db_session()
-        result = session.execute(text(query), params or {})
-        rows = [dict(row._mapping) for row in result]
-        session.close()
-        return rows
+        engine = get_db_engine()
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            result = connection.execute(_statement(query), params or {})
+            return [dict(row._mapping) for row in result]
     except SQLAlchemyError as e:
         logger.error(f"Error executing query: {e}")
-        if session:
-            session.close()
         raise 
\ No newline at end of file
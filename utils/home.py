@@ -0,0 +1,92 @@
+"""
+SportsIQ - Home Page Components
+Building blocks shared by the home page entry points (app.py and streamlit_app.py)
+"""
+import streamlit as st
+
+@st.cache_data(show_spinner=False)
+def show_health_indicator(score, label):
+    """Display a health indicator gauge chart"""
+    import plotly.graph_objects as go
+
+    colors = {
+        'good': '#2E7D32',
+        'medium': '#FF9800',
+        'poor': '#C62828'
+    }
+
+    if score >= 70:
+        color = colors['good']
+        status = "Excellent"
+    elif score >= 40:
+        color = colors['medium']
+        status = "Moderate"
+    else:
+        color = colors['poor']
+        status = "Poor"
+
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=score,
+        title={'text': label, 'font': {'size': 14}},
+        gauge={
+            'axis': {'range': [0, 100], 'tickwidth': 1},
+            'bar': {'color': color},
+            'steps': [
+                {'range': [0, 40], 'color': '#FFEBEE'},
+                {'range': [40, 70], 'color': '#FFF9C4'},
+                {'range': [70, 100], 'color': '#E8F5E9'}
+            ],
+            'threshold': {
+                'line': {'color': "black", 'width': 2},
+                'thickness': 0.75,
+                'value': score
+            }
+        }
+    ))
+
+    fig.update_layout(
+        height=150,
+        margin=dict(l=10, r=10, t=25, b=10),
+    )
+
+    return fig, status
+
+def render_system_health(db_score, api_score, freshness_score):
+    """Render the row of system health gauges"""
+    indicators = (
+        (db_score, "Database Status", "gauge_database"),
+        (api_score, "NBA API Status", "gauge_api"),
+        (freshness_score, "Data Freshness", "gauge_freshness"),
+    )
+
+    for col, (score, label, key) in zip(st.columns(3), indicators):
+        with col:
+            fig, status = show_health_indicator(score, label)
+            st.plotly_chart(fig, use_container_width=True, key=key)
+            st.markdown(f"<div style='text-align: center;'><b>Status:</b> {status}</div>", unsafe_allow_html=True)
+
+@st.cache_data
+def metrics_html(stats):
+    """Build the dashboard overview metric cards as a single HTML row"""
+    cards = [
+        f'<div class="metric-card"><div class="metric-value">{stats["total_teams"]}</div><div class="metric-label">NBA Teams</div></div>',
+        f'<div class="metric-card"><div class="metric-value">{stats["total_players"]}</div><div class="metric-label">Players Tracked</div></div>',
+        f'<div class="metric-card"><div class="metric-value">{stats["games_analyzed"]}</div><div class="metric-label">Games Analyzed</div></div>',
+        f'<div class="metric-card"><div class="metric-value">{stats["data_points"]}</div><div class="metric-label">Data Points</div></div>',
+    ]
+    return f'<div class="metric-row">{"".join(cards)}</div>'
+
+def feature_card(title, items):
+    """Build the HTML for a single feature card"""
+    bullets = "".join(f"<li>{item}</li>" for item in items)
+    return f'<div class="card"><div class="feature-header">{title}</div><ul>{bullets}</ul></div>'
+
+@st.cache_data
+def features_html(feature_columns):
+    """Build the feature cards as a two-column CSS grid"""
+    columns = "".join(
+        f'<div>{"".join(feature_card(title, items) for title, items in column)}</div>'
+        for column in feature_columns
+    )
+    return f'<div class="feature-grid">{columns}</div>'
@@ -1,18 +1,35 @@
 """
 Logging utilities for the SportsIQ application.
 """
+import atexit
 import logging
 import os
+import queue
 import sys
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 from sportsiq.utils.env_utils import get_log_level, is_debug_mode
 
+# Background listener that performs the actual log I/O
+_queue_listener = None
+
+def _stop_queue_listener():
+    """Flush and stop the background log listener"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+atexit.register(_stop_queue_listener)
+
 def setup_logging(app_name="sportsiq"):
     """
     Set up logging for the application.
     
+    Records are put on an in-memory queue and written to the console and
+    log file by a background thread, so logging calls never block on I/O.
+    
     Args:
         app_name (str): Name of the application for the logger
         
@@ -43,7 +60,7 @@ def setup_logging(app_name="sportsiq"):
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(log_format)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # File handler (if not in debug mode)
     if not is_debug_mode():
@@ -56,7 +73,15 @@ def setup_logging(app_name="sportsiq"):
             log_file, maxBytes=10*1024*1024, backupCount=5
         )
         file_handler.setFormatter(log_format)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Hand the real handlers to a background listener fed by a queue
+    global _queue_listener
+    _stop_queue_listener()
+    log_queue = queue.Queue(-1)
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+    logger.addHandler(QueueHandler(log_queue))
     
     logger.info(f"Logger configured with level: {logging.getLevelName(log_level)}")
     return logger
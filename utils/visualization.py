@@ -0,0 +1,62 @@
+"""
+Visualization utilities for the SportsIQ application.
+"""
+import numpy as np
+
+# Maximum number of points sent to the browser for a single time-series trace
+MAX_CHART_POINTS = 1000
+
+def lttb_downsample(x, y, threshold=MAX_CHART_POINTS):
+    """
+    Downsample a time series with the Largest-Triangle-Three-Buckets algorithm.
+
+    LTTB keeps the first and last points and, for every bucket in between,
+    the point forming the largest triangle with its neighbours, so the
+    visual shape of the series is preserved with far fewer points.
+
+    Args:
+        x (array-like): X values (numeric or datetime), sorted ascending
+        y (array-like): Y values
+        threshold (int): Maximum number of points to return
+
+    Returns:
+        tuple: (x, y) NumPy arrays with at most ``threshold`` points
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+
+    if threshold >= n or threshold < 3:
+        return x, y
+
+    # Triangle areas are computed on a float view of the x axis
+    if np.issubdtype(x.dtype, np.datetime64):
+        x_num = x.astype("datetime64[ns]").astype(np.int64).astype(float)
+    else:
+        x_num = x.astype(float)
+
+    # Bucket boundaries for the points between the fixed first and last ones
+    every = (n - 2) / (threshold - 2)
+    edges = (np.arange(threshold - 1) * every).astype(int) + 1
+    edges[-1] = n - 1
+
+    sampled = np.empty(threshold, dtype=np.intp)
+    sampled[0], sampled[-1] = 0, n - 1
+
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_hi = edges[i + 2] if i + 2 < len(edges) else n
+
+        # Average of the next bucket is the third triangle vertex
+        avg_x = x_num[hi:next_hi].mean()
+        avg_y = y[hi:next_hi].mean()
+
+        area = np.abs(
+            (x_num[a] - avg_x) * (y[lo:hi] - y[a])
+            - (x_num[a] - x_num[lo:hi]) * (avg_y - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        sampled[i + 1] = a
+
+    return x[sampled], y[sampled]